@@ -4,6 +4,7 @@ import plotly.express as px
 from pathlib import Path
 from app.data.db import connect_database
 from app.data.schema import create_all_tables
+from app.data.importer import import_csv, is_import_unfinished
 
 st.set_page_config(page_title="Dashboard", page_icon="shield", layout="wide")
 
@@ -37,15 +38,14 @@ def load_csv():
     conn = connect_database()
     cursor = conn.cursor()
     for table, csv_file in {'cyber_incidents': 'cyber_incidents.csv', 'it_tickets': 'it_tickets.csv', 'datasets_metadata': 'datasets_metadata.csv'}.items():
+        csv_path = Path("DATA") / csv_file
+        if not csv_path.exists():
+            continue
         cursor.execute(f"SELECT COUNT(*) FROM {table}")
-        if cursor.fetchone()[0] == 0:
-            csv_path = Path("DATA") / csv_file
-            if csv_path.exists():
-                df = pd.read_csv(csv_path)
-                if 'id' in df.columns:
-                    df = df.drop('id', axis=1)
-                df.to_sql(table, conn, if_exists='append', index=False)
-    conn.commit()
+        empty = cursor.fetchone()[0] == 0
+        # Stream in chunks; an interrupted import picks up where it stopped
+        if empty or is_import_unfinished(conn, csv_path, table):
+            import_csv(csv_path, table, conn=conn, skip_columns=('id',), resume=not empty)
     conn.close()
 
 try:
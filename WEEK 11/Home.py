@@ -1,6 +1,5 @@
 import streamlit as st
-import pandas as pd
-import os
+from services.data_files import read_data_file
 
 st.set_page_config(page_title="Multi-Domain Intelligence Platform", page_icon="🌐", layout="wide")
 st.title("Multi-Domain Intelligence Platform")
@@ -32,26 +31,26 @@ else:
     
     try:
         cyber_file = "files/cyber_incidents.csv"
-        cyber_df = pd.read_csv(cyber_file) if os.path.exists(cyber_file) else pd.DataFrame()
+        # Parsed once per file version and shared across reruns, users and pages
+        cyber_df = read_data_file(cyber_file)
         security_count = len(cyber_df)
         critical_count = len(cyber_df[cyber_df['severity'] == 'critical']) if len(cyber_df) > 0 else 0
         
         dataset_file = "files/datasets_metadata.csv"
-        dataset_df = pd.read_csv(dataset_file) if os.path.exists(dataset_file) else pd.DataFrame()
+        dataset_df = read_data_file(dataset_file)
         dataset_count = len(dataset_df)
         total_size = dataset_df['size'].sum() / 1024 if len(dataset_df) > 0 else 0
         
         ticket_file = "files/it_tickets.csv"
-        ticket_df = pd.read_csv(ticket_file) if os.path.exists(ticket_file) else pd.DataFrame()
+        ticket_df = read_data_file(ticket_file)
         ticket_count = len(ticket_df)
         open_count = len(ticket_df[ticket_df['status'] == 'open']) if len(ticket_df) > 0 else 0
         
         from services.database_manager import DatabaseManager
-        db = DatabaseManager("database/platform.db")
-        db.connect()
-        user_stats = db.fetch_one("SELECT COUNT(*) FROM users")
-        user_count = user_stats[0] if user_stats else 0
-        db.close()
+        from services.platform_stats import get_platform_stats_service
+        from database.migrations import ensure_migrated
+        ensure_migrated("database/platform.db")
+        user_count = get_platform_stats_service("database/platform.db").get_stats().count("users")
         
     except Exception as e:
         st.error(f"Could not load statistics: {e}")
@@ -106,6 +105,8 @@ else:
             st.write("**Data Files**: Connected")
             st.write("**Authentication**: Active")
             st.write("**All Modules**: Operational")
+            db_info = DatabaseManager("database/platform.db", pooled=True).profile_info()
+            st.write(f"**Database Profile**: {db_info['profile']} (journal: {db_info['settings']['journal_mode']})")
         except Exception as e:
             st.warning(f"Error loading dataset details: {e}")
     
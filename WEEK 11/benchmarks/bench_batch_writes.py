@@ -0,0 +1,68 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Add parent directory to path to import services
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.database_manager import DatabaseManager
+
+CREATE_SQL = """
+    CREATE TABLE security_incidents (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        incident_type TEXT NOT NULL,
+        severity TEXT NOT NULL,
+        status TEXT NOT NULL,
+        description TEXT NOT NULL
+    )
+"""
+INSERT_SQL = "INSERT INTO security_incidents (incident_type, severity, status, description) VALUES (?, ?, ?, ?)"
+
+
+def make_rows(n: int) -> list:
+    """Build n synthetic incident rows."""
+    severities = ["low", "medium", "high", "critical"]
+    return [("Phishing", severities[i % 4], "Open", f"Incident {i}") for i in range(n)]
+
+
+def run(label: str, n: int, write) -> None:
+    """Time one write strategy against a fresh database file."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(os.path.join(tmp, "bench.db"))
+        db.execute_query(CREATE_SQL)
+        rows = make_rows(n)
+        start = time.perf_counter()
+        write(db, rows)
+        elapsed = time.perf_counter() - start
+        count = db.fetch_one("SELECT COUNT(*) FROM security_incidents")[0]
+        db.close()
+    print(f"{label:<22} {n:>9,} rows  {elapsed:8.3f}s  {n / elapsed:12,.0f} rows/s  (stored {count:,})")
+
+
+def per_row_commit(db: DatabaseManager, rows: list) -> None:
+    for row in rows:
+        db.execute_query(INSERT_SQL, row)
+
+
+def transaction_execute_query(db: DatabaseManager, rows: list) -> None:
+    with db.transaction():
+        for row in rows:
+            db.execute_query(INSERT_SQL, row)
+
+
+def execute_many(db: DatabaseManager, rows: list) -> None:
+    db.execute_many(INSERT_SQL, rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare per-row commits with batched writes.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    for n in args.rows:
+        run("per-row commit", n, per_row_commit)
+        run("transaction()", n, transaction_execute_query)
+        run("execute_many()", n, execute_many)
+        print()
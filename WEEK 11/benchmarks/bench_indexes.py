@@ -0,0 +1,107 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add parent directory to path to import services and database
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.database_manager import DatabaseManager
+from database.migrations import migrate
+
+CREATE_SQL = [
+    """CREATE TABLE security_incidents (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        incident_type TEXT NOT NULL,
+        severity TEXT NOT NULL,
+        status TEXT NOT NULL,
+        description TEXT NOT NULL
+    )""",
+    """CREATE TABLE it_tickets (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        priority TEXT NOT NULL,
+        status TEXT NOT NULL,
+        assigned_to TEXT NOT NULL
+    )""",
+    """CREATE TABLE datasets (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        size_bytes INTEGER NOT NULL,
+        rows INTEGER NOT NULL,
+        source TEXT NOT NULL
+    )""",
+]
+
+QUERIES = [
+    ("critical active incidents",
+     "SELECT COUNT(*) FROM security_incidents WHERE severity = 'critical' AND status != 'Resolved'"),
+    ("incidents by severity filter",
+     "SELECT id, incident_type, severity, status FROM security_incidents WHERE severity = 'high' AND status = 'Open'"),
+    ("incidents by type filter",
+     "SELECT COUNT(*) FROM security_incidents WHERE incident_type = 'Phishing'"),
+    ("open tickets count",
+     "SELECT COUNT(*) FROM it_tickets WHERE status = 'Open'"),
+    ("tickets for one assignee",
+     "SELECT id, title FROM it_tickets WHERE assigned_to = 'user42' AND status = 'Open'"),
+    ("in-progress critical tickets",
+     "SELECT COUNT(*) FROM it_tickets WHERE status = 'In Progress' AND priority = 'critical'"),
+]
+
+
+def populate(db: DatabaseManager, n: int) -> None:
+    """Fill incidents and tickets with n synthetic rows each."""
+    rng = random.Random(42)
+    types = ["Malware", "Phishing", "Data Breach", "DDoS", "Ransomware", "Insider Threat", "SQL Injection"]
+    severities = ["low", "medium", "high", "critical"]
+    incident_statuses = ["Open", "In Progress", "Resolved", "Resolved", "Resolved"]
+    ticket_statuses = ["Open", "In Progress", "Closed", "Closed", "Closed"]
+    for sql in CREATE_SQL:
+        db.execute_query(sql)
+    db.execute_many(
+        "INSERT INTO security_incidents (incident_type, severity, status, description) VALUES (?, ?, ?, ?)",
+        ((rng.choice(types), rng.choice(severities), rng.choice(incident_statuses), f"Incident {i}") for i in range(n)),
+    )
+    db.execute_many(
+        "INSERT INTO it_tickets (title, priority, status, assigned_to) VALUES (?, ?, ?, ?)",
+        ((f"Ticket {i}", rng.choice(severities), rng.choice(ticket_statuses), f"user{rng.randrange(200)}") for i in range(n)),
+    )
+
+
+def time_queries(db: DatabaseManager, repeat: int) -> dict[str, float]:
+    """Return the best-of-`repeat` time in ms for each benchmark query."""
+    results = {}
+    for label, sql in QUERIES:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            db.fetch_all(sql)
+            best = min(best, time.perf_counter() - start)
+        results[label] = best * 1000
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query timings before and after the index migration.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(os.path.join(tmp, "bench.db"))
+        print(f"Populating {args.rows:,} incidents and tickets...")
+        populate(db, args.rows)
+
+        before = time_queries(db, args.repeat)
+        start = time.perf_counter()
+        # Only the index migration: later ones need the full platform schema
+        migrate(db, target=1)
+        print(f"Migration took {time.perf_counter() - start:.2f}s")
+        after = time_queries(db, args.repeat)
+        db.close()
+
+    print(f"\n{'query':<30} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+    for label, _ in QUERIES:
+        print(f"{label:<30} {before[label]:>10.2f} {after[label]:>10.2f} {before[label] / after[label]:>7.1f}x")
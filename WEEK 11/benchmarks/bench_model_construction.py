@@ -0,0 +1,63 @@
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+# Add parent directory to path to import models
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.it_ticket import ITTicket
+
+PRIORITIES = ["low", "medium", "high", "urgent"]
+STATUSES = ["open", "in-progress", "resolved", "closed"]
+
+
+def make_frame(n: int) -> pd.DataFrame:
+    """Build an n-row frame shaped like files/it_tickets.csv, with categorical columns."""
+    return pd.DataFrame({
+        "id": range(1, n + 1),
+        "title": [f"Ticket {i}" for i in range(1, n + 1)],
+        "priority": pd.Categorical([PRIORITIES[i % 4] for i in range(n)]),
+        "status": pd.Categorical([STATUSES[i % 4] for i in range(n)]),
+        "created_date": ["2024-01-02"] * n,
+    })
+
+
+def iterrows(df: pd.DataFrame) -> list:
+    """The original page loop."""
+    return [
+        ITTicket(int(row['id']), str(row['title']), str(row['priority']), str(row['status']), str(row['created_date']))
+        for _, row in df.iterrows()
+    ]
+
+
+def timed(label: str, n: int, func) -> None:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {n:>10,} rows  {elapsed:8.3f}s  {n / elapsed:12,.0f} rows/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare ways of building ITTicket objects from a DataFrame.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows for the bulk constructors")
+    parser.add_argument("--iterrows-rows", type=int, default=100_000,
+                        help="rows for the iterrows baseline (it is too slow to run at full size)")
+    args = parser.parse_args()
+
+    df = make_frame(args.rows)
+    sample = df.head(args.iterrows_rows)
+    rows = list(df.itertuples(index=False, name=None))
+
+    timed("iterrows (baseline)", len(sample), lambda: iterrows(sample))
+    timed("from_dataframe", args.rows, lambda: ITTicket.from_dataframe(df))
+    timed("from_rows (pre-built tuples)", args.rows, lambda: ITTicket.from_rows(rows))
+    timed("from_dataframe(lazy=True)", args.rows, lambda: ITTicket.from_dataframe(df, lazy=True))
+    lazy = ITTicket.from_dataframe(df, lazy=True)
+    timed("  then read one page of 50", 50, lambda: lazy[:50])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+import types
+
+# Add parent directory to path to import models
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.dataset import Dataset
+from models.it_ticket import ITTicket
+from models.security_incident import SecurityIncident
+from models.user import User
+
+SEVERITIES = ["low", "medium", "high", "critical"]
+
+# Model class -> builder for the i-th synthetic instance
+BUILDERS = {
+    SecurityIncident: lambda cls, i: cls(i, "2024-01-02", "Phishing", SEVERITIES[i % 4], "Open", f"Incident {i}", "user1"),
+    ITTicket: lambda cls, i: cls(i, f"Ticket {i}", "medium", "open", "2024-01-02"),
+    Dataset: lambda cls, i: cls(i, f"Dataset_{i}", "Internal", "Security", i),
+    User: lambda cls, i: cls(f"user{i}", "hash", "user"),
+}
+
+
+def without_slots(cls: type) -> type:
+    """Rebuild a model class with a per-instance __dict__, as the models were before __slots__."""
+    namespace = {
+        name: value for name, value in vars(cls).items()
+        if name != "__slots__" and not isinstance(value, types.MemberDescriptorType)
+    }
+    return type(f"Dict{cls.__name__}", cls.__bases__, namespace)
+
+
+def measure(cls: type, builder, n: int) -> tuple[float, int]:
+    """Build n instances; return (seconds, bytes allocated)."""
+    gc.collect()
+    start = time.perf_counter()
+    items = [builder(cls, i) for i in range(n)]
+    elapsed = time.perf_counter() - start
+    del items
+    gc.collect()
+    # Memory is measured in a second pass because tracemalloc slows construction
+    tracemalloc.start()
+    items = [builder(cls, i) for i in range(n)]
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return elapsed, allocated
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare __slots__ models with __dict__-based equivalents.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000], help="instance counts")
+    args = parser.parse_args()
+
+    print(f"{'model':<18} {'n':>10}  {'dict MB':>9} {'slots MB':>9} {'saved':>6}  {'dict s':>7} {'slots s':>7}")
+    for model, builder in BUILDERS.items():
+        baseline = without_slots(model)
+        for n in args.sizes:
+            dict_time, dict_bytes = measure(baseline, builder, n)
+            slot_time, slot_bytes = measure(model, builder, n)
+            print(
+                f"{model.__name__:<18} {n:>10,}  {dict_bytes / 1e6:9.1f} {slot_bytes / 1e6:9.1f} "
+                f"{1 - slot_bytes / dict_bytes:6.0%}  {dict_time:7.3f} {slot_time:7.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import argparse
+import gc
+import os
+import sqlite3
+import sys
+import time
+import tracemalloc
+
+# Add parent directory to path to import models
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import security_incident
+from models.security_incident import SecurityIncident
+
+TYPES = ["Phishing", "Malware", "DDoS", "Ransomware", "Data Breach"]
+SEVERITIES = ["low", "medium", "high", "critical"]
+STATUSES = ["Open", "In Progress", "Resolved"]
+
+
+class PassThrough:
+    """Stands in for a vocabulary to measure the models as they were before interning."""
+
+    def intern(self, value):
+        return value
+
+
+def make_database(n: int) -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE security_incidents (id INTEGER PRIMARY KEY, incident_type TEXT, "
+                 "severity TEXT, status TEXT, description TEXT)")
+    conn.executemany(
+        "INSERT INTO security_incidents VALUES (?, ?, ?, ?, ?)",
+        ((i, TYPES[i % 5], SEVERITIES[i % 4], STATUSES[i % 3], f"Incident {i}") for i in range(n)),
+    )
+    return conn
+
+
+def load(conn: sqlite3.Connection) -> list:
+    """Build models from freshly read rows; SQLite returns a new str per value."""
+    rows = conn.execute("SELECT id, incident_type, severity, status, description FROM security_incidents")
+    return [SecurityIncident(r[0], "", r[1], r[2], r[3], r[4], "") for r in rows]
+
+
+def measure(conn: sqlite3.Connection) -> tuple[float, int, float]:
+    """Return (build seconds, bytes retained by the models, filter seconds)."""
+    gc.collect()
+    start = time.perf_counter()
+    items = load(conn)
+    elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    open_items = [item for item in items if item.get_status() == "Open"]
+    filtered = time.perf_counter() - start
+    del items, open_items
+    gc.collect()
+    tracemalloc.start()
+    items = load(conn)
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return elapsed, retained, filtered
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare interned vs per-row strings for categorical model fields.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000], help="row counts")
+    args = parser.parse_args()
+
+    vocabularies = (security_incident.INCIDENT_TYPES, security_incident.SEVERITIES, security_incident.STATUSES)
+    print(f"{'n':>10}  {'plain MB':>9} {'interned MB':>11} {'saved':>6}  {'build s':>7} {'->':>7}  {'filter s':>8} {'->':>7}")
+    for n in args.sizes:
+        conn = make_database(n)
+        security_incident.INCIDENT_TYPES = security_incident.SEVERITIES = security_incident.STATUSES = PassThrough()
+        plain_time, plain_bytes, plain_filter = measure(conn)
+        security_incident.INCIDENT_TYPES, security_incident.SEVERITIES, security_incident.STATUSES = vocabularies
+        time_, bytes_, filter_ = measure(conn)
+        print(
+            f"{n:>10,}  {plain_bytes / 1e6:9.1f} {bytes_ / 1e6:11.1f} {1 - bytes_ / plain_bytes:6.0%}  "
+            f"{plain_time:7.3f} {time_:7.3f}  {plain_filter:8.4f} {filter_:7.4f}"
+        )
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
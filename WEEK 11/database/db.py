@@ -1,3 +1,4 @@
+import asyncio
 import os
 import sys
 
@@ -6,6 +7,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from services.database_manager import DatabaseManager
 from services.auth_manager import AuthManager
+from services.async_database import print_table_counts
+from database.migrations import migrate
 
 
 def get_db_path() -> str:
@@ -15,9 +18,9 @@ def get_db_path() -> str:
     return db_path
 
 
-def initialize_database() -> None:
+def initialize_database(db_path: str | None = None) -> None:
     """Initialize the database with all required tables using DatabaseManager."""
-    db_path = get_db_path()
+    db_path = db_path or get_db_path()
     db = DatabaseManager(db_path)
     db.connect()
     
@@ -68,6 +71,9 @@ def initialize_database() -> None:
         
         print("✅ Database tables created successfully!")
         
+        # Bring indexes and later schema changes up to date
+        migrate(db)
+        
     except Exception as e:
         print(f"❌ Error initializing database: {e}")
         raise
@@ -84,64 +90,48 @@ def seed_sample_data() -> None:
     try:
         print("\n🌱 Seeding sample data...")
         
-        # Add sample users using AuthManager
-        print("  Adding users...")
-        auth.register_user("alice", "password123", "admin")
-        auth.register_user("bob", "password456", "analyst")
-        auth.register_user("charlie", "password789", "user")
-        
-        # Add sample security incidents
-        print("  Adding security incidents...")
-        db.execute_query(
-            "INSERT INTO security_incidents (incident_type, severity, status, description) VALUES (?, ?, ?, ?)",
-            ("Malware Detection", "critical", "Open", "Ransomware detected on server-03")
-        )
-        db.execute_query(
-            "INSERT INTO security_incidents (incident_type, severity, status, description) VALUES (?, ?, ?, ?)",
-            ("SQL Injection", "high", "In Progress", "Attempted SQL injection on login page")
-        )
-        db.execute_query(
-            "INSERT INTO security_incidents (incident_type, severity, status, description) VALUES (?, ?, ?, ?)",
-            ("DDoS Attack", "medium", "Resolved", "Brief DDoS attack on main website")
-        )
-        db.execute_query(
-            "INSERT INTO security_incidents (incident_type, severity, status, description) VALUES (?, ?, ?, ?)",
-            ("Unauthorized Access", "high", "Open", "Suspicious login attempts from unknown IP")
-        )
-        
-        # Add sample datasets
-        print("  Adding datasets...")
-        db.execute_query(
-            "INSERT INTO datasets (name, size_bytes, rows, source) VALUES (?, ?, ?, ?)",
-            ("Customer Analytics", 52428800, 10000, "Internal Database")
-        )
-        db.execute_query(
-            "INSERT INTO datasets (name, size_bytes, rows, source) VALUES (?, ?, ?, ?)",
-            ("Sales Data 2024", 104857600, 25000, "Kaggle")
-        )
-        db.execute_query(
-            "INSERT INTO datasets (name, size_bytes, rows, source) VALUES (?, ?, ?, ?)",
-            ("User Behavior Logs", 209715200, 50000, "Internal Logs")
-        )
-        
-        # Add sample IT tickets
-        print("  Adding IT tickets...")
-        db.execute_query(
-            "INSERT INTO it_tickets (title, priority, status, assigned_to) VALUES (?, ?, ?, ?)",
-            ("VPN connection issues", "high", "Open", "alice")
-        )
-        db.execute_query(
-            "INSERT INTO it_tickets (title, priority, status, assigned_to) VALUES (?, ?, ?, ?)",
-            ("Password reset request", "medium", "In Progress", "bob")
-        )
-        db.execute_query(
-            "INSERT INTO it_tickets (title, priority, status, assigned_to) VALUES (?, ?, ?, ?)",
-            ("Software installation needed", "low", "Open", "alice")
-        )
-        db.execute_query(
-            "INSERT INTO it_tickets (title, priority, status, assigned_to) VALUES (?, ?, ?, ?)",
-            ("Email not working", "critical", "Open", "bob")
-        )
+        # One transaction for the whole seed instead of a commit per row
+        with db.transaction():
+            # Add sample users using AuthManager
+            print("  Adding users...")
+            auth.register_user("alice", "password123", "admin")
+            auth.register_user("bob", "password456", "analyst")
+            auth.register_user("charlie", "password789", "user")
+            
+            # Add sample security incidents
+            print("  Adding security incidents...")
+            db.execute_many(
+                "INSERT INTO security_incidents (incident_type, severity, status, description) VALUES (?, ?, ?, ?)",
+                [
+                    ("Malware Detection", "critical", "Open", "Ransomware detected on server-03"),
+                    ("SQL Injection", "high", "In Progress", "Attempted SQL injection on login page"),
+                    ("DDoS Attack", "medium", "Resolved", "Brief DDoS attack on main website"),
+                    ("Unauthorized Access", "high", "Open", "Suspicious login attempts from unknown IP"),
+                ]
+            )
+            
+            # Add sample datasets
+            print("  Adding datasets...")
+            db.execute_many(
+                "INSERT INTO datasets (name, size_bytes, rows, source) VALUES (?, ?, ?, ?)",
+                [
+                    ("Customer Analytics", 52428800, 10000, "Internal Database"),
+                    ("Sales Data 2024", 104857600, 25000, "Kaggle"),
+                    ("User Behavior Logs", 209715200, 50000, "Internal Logs"),
+                ]
+            )
+            
+            # Add sample IT tickets
+            print("  Adding IT tickets...")
+            db.execute_many(
+                "INSERT INTO it_tickets (title, priority, status, assigned_to) VALUES (?, ?, ?, ?)",
+                [
+                    ("VPN connection issues", "high", "Open", "alice"),
+                    ("Password reset request", "medium", "In Progress", "bob"),
+                    ("Software installation needed", "low", "Open", "alice"),
+                    ("Email not working", "critical", "Open", "bob"),
+                ]
+            )
         
         print("✅ Sample data added successfully!")
         
@@ -162,6 +152,8 @@ def reset_database() -> None:
     print("🔧 Creating fresh database...")
     initialize_database()
     seed_sample_data()
+    print("\n📊 Table row counts:")
+    asyncio.run(print_table_counts(db_path))
     print("\n✅ Database reset complete!")
     print("\n📝 Test credentials:")
     print("   Username: alice | Password: password123 (admin)")
@@ -0,0 +1,132 @@
+import argparse
+import os
+import sys
+import threading
+
+# Add parent directory to path to import services
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.database_manager import DatabaseManager
+from services.change_feed import change_tracking_sql
+from services.kpi_counters import COUNTER_TABLE_SQL, counter_rebuild_sql, counter_trigger_sql, rebuild_counters
+from services.search_index import search_index_sql
+from models.it_ticket import PRIORITY_RANKS
+from models.security_incident import SEVERITY_RANKS
+
+
+
+def _rank_expression(column: str, ranks: dict[str, int]) -> str:
+    """CASE expression mapping a text column to its integer rank (0 if unknown)."""
+    cases = " ".join(f"WHEN '{value}' THEN {rank}" for value, rank in ranks.items())
+    return f"CASE lower({column}) {cases} ELSE 0 END"
+
+
+# Ordered schema migrations. Each entry moves PRAGMA user_version to `version`.
+# Version 0 is the bare tables created by db.initialize_database().
+MIGRATIONS: list[tuple[int, str, list[str]]] = [
+    (1, "Secondary indexes for dashboard filters and AI Assistant counts", [
+        # Filter dropdowns and severity/status counts
+        "CREATE INDEX IF NOT EXISTS idx_incidents_severity_status ON security_incidents (severity, status)",
+        "CREATE INDEX IF NOT EXISTS idx_incidents_status ON security_incidents (status)",
+        "CREATE INDEX IF NOT EXISTS idx_incidents_type ON security_incidents (incident_type)",
+        # "Active" incidents by severity: WHERE severity = ? AND status != 'Resolved'
+        "CREATE INDEX IF NOT EXISTS idx_incidents_active_severity ON security_incidents (severity) "
+        "WHERE status != 'Resolved'",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_status_priority ON it_tickets (status, priority)",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_priority ON it_tickets (priority)",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_assigned_status ON it_tickets (assigned_to, status)",
+        "CREATE INDEX IF NOT EXISTS idx_datasets_source ON datasets (source)",
+        "ANALYZE",
+    ]),
+    (2, "Trigger-maintained KPI counters", [
+        COUNTER_TABLE_SQL,
+        *counter_trigger_sql(),
+        *counter_rebuild_sql(),
+    ]),
+    (3, "FTS5 search over incident descriptions and ticket titles", search_index_sql()),
+    (4, "Row versions and delete tombstones for the incident and ticket change feed", change_tracking_sql()),
+    (5, "Indexed severity and priority ranks for most-urgent-first ordering", [
+        # Virtual generated columns cost no row storage; the indexes hold the ranks
+        "ALTER TABLE security_incidents ADD COLUMN severity_rank INTEGER "
+        f"GENERATED ALWAYS AS ({_rank_expression('severity', SEVERITY_RANKS)}) VIRTUAL",
+        "CREATE INDEX IF NOT EXISTS idx_incidents_severity_rank ON security_incidents (severity_rank DESC, id)",
+        "ALTER TABLE it_tickets ADD COLUMN priority_rank INTEGER "
+        f"GENERATED ALWAYS AS ({_rank_expression('priority', PRIORITY_RANKS)}) VIRTUAL",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_priority_rank ON it_tickets (priority_rank DESC, id)",
+        "ANALYZE",
+    ]),
+    (6, "Rank critical tickets as top priority", [
+        # A generated column's expression cannot be altered, so databases already
+        # at version 5 drop and re-add it
+        "DROP INDEX IF EXISTS idx_tickets_priority_rank",
+        "ALTER TABLE it_tickets DROP COLUMN priority_rank",
+        "ALTER TABLE it_tickets ADD COLUMN priority_rank INTEGER "
+        f"GENERATED ALWAYS AS ({_rank_expression('priority', PRIORITY_RANKS)}) VIRTUAL",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_priority_rank ON it_tickets (priority_rank DESC, id)",
+        "ANALYZE",
+    ]),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0] if MIGRATIONS else 0
+
+
+def get_schema_version(db: DatabaseManager) -> int:
+    """Return the schema version stored in PRAGMA user_version."""
+    return db.fetch_one("PRAGMA user_version")[0]
+
+
+def migrate(db: DatabaseManager, target: int = LATEST_VERSION) -> list[int]:
+    """Apply every pending migration up to `target`, each in its own transaction.
+    Returns the versions that were applied.
+    """
+    applied = []
+    current = get_schema_version(db)
+    for version, description, statements in MIGRATIONS:
+        if version <= current or version > target:
+            continue
+        print(f"  Applying migration {version}: {description}")
+        with db.transaction():
+            for sql in statements:
+                db.execute_query(sql)
+            db.execute_query(f"PRAGMA user_version = {int(version)}")
+        applied.append(version)
+    return applied
+
+
+_migrated_paths: set[str] = set()
+_migrated_lock = threading.Lock()
+
+
+def ensure_migrated(db_path: str) -> None:
+    """Apply pending migrations once per process before a page uses the database."""
+    key = os.path.abspath(db_path)
+    with _migrated_lock:
+        if key in _migrated_paths:
+            return
+        db = DatabaseManager(db_path)
+        try:
+            if get_schema_version(db) < LATEST_VERSION:
+                migrate(db)
+        finally:
+            db.close()
+        _migrated_paths.add(key)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Upgrade platform.db to the latest schema version.")
+    parser.add_argument("--rebuild-counters", action="store_true", help="recompute kpi_counters from the tables")
+    args = parser.parse_args()
+
+    db = DatabaseManager(os.path.join(os.path.dirname(os.path.abspath(__file__)), "platform.db"))
+    try:
+        print(f"🔧 Schema version: {get_schema_version(db)}")
+        applied = migrate(db)
+        if applied:
+            print(f"✅ Upgraded to version {get_schema_version(db)}")
+        else:
+            print("✅ Database is already up to date")
+        if args.rebuild_counters:
+            rebuild_counters(db)
+            print("✅ KPI counters rebuilt")
+    finally:
+        db.close()
@@ -1,13 +1,43 @@
+from itertools import starmap
+from typing import Iterable
+
+from models.lazy import LazyModelList
+from models.vocabulary import get_vocabulary
+
+# Shared interned values for the low-cardinality fields
+SOURCES = get_vocabulary("source")
+CATEGORIES = get_vocabulary("category")
+
+
 class Dataset:
     """Represents a data science dataset in the platform."""
     
+    # Fixed attribute slots instead of a per-instance __dict__
+    __slots__ = ("__id", "__name", "__source", "__category", "__size")
+    
     def __init__(self, dataset_id: int, name: str, source: str, category: str, size: int):
         self.__id = dataset_id
         self.__name = name
-        self.__source = source
-        self.__category = category
+        self.__source = SOURCES.intern(source)
+        self.__category = CATEGORIES.intern(category)
         self.__size = size  # Size in KB
     
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple]) -> list["Dataset"]:
+        """Build datasets from (id, name, source, category, size) tuples."""
+        return list(starmap(cls, rows))
+    
+    @classmethod
+    def from_dataframe(cls, df, lazy: bool = False) -> "list[Dataset] | LazyModelList":
+        """Build datasets column-wise from a DataFrame with the CSV columns.
+        With lazy=True each object is only created when it is first accessed.
+        """
+        columns = [df['id'].astype(int).tolist(), df['name'].astype(str).tolist(), df['source'].astype(str).tolist(),
+                   df['category'].astype(str).tolist(), df['size'].astype(int).tolist()]
+        if lazy:
+            return LazyModelList(cls, columns)
+        return cls.from_rows(zip(*columns))
+    
     def get_id(self) -> int:
         """Get dataset ID."""
         return self.__id
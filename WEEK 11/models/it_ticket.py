@@ -1,12 +1,49 @@
+from itertools import starmap
+from typing import Iterable
+
+from models.lazy import LazyModelList
+from models.vocabulary import get_vocabulary
+
+# Priority -> rank, also stored as the indexed priority_rank column (migrations 5-6).
+# The CSV uses "urgent" and the database seed "critical" for the top priority.
+PRIORITY_RANKS = {"low": 1, "medium": 2, "high": 3, "urgent": 4, "critical": 4}
+
+# Shared interned values for the low-cardinality fields
+PRIORITIES = get_vocabulary("priority")
+STATUSES = get_vocabulary("status")
+
+
 class ITTicket:
     """Represents an IT support ticket."""
     
-    def __init__(self, ticket_id: int, title: str, priority: str, status: str, created_date: str):
+    # Fixed attribute slots instead of a per-instance __dict__
+    __slots__ = ("__id", "__title", "__priority", "__status", "__created_date", "__priority_level")
+    
+    def __init__(self, ticket_id: int, title: str, priority: str, status: str, created_date: str,
+                 priority_level: int | None = None):
         self.__id = ticket_id
         self.__title = title
-        self.__priority = priority
-        self.__status = status
+        self.__priority = PRIORITIES.intern(priority)
+        self.__status = STATUSES.intern(status)
         self.__created_date = created_date
+        # Rank read from the database when available, otherwise computed once here
+        self.__priority_level = priority_level if priority_level is not None else PRIORITY_RANKS.get(priority.lower(), 0)
+    
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple]) -> list["ITTicket"]:
+        """Build tickets from (id, title, priority, status, created_date) tuples."""
+        return list(starmap(cls, rows))
+    
+    @classmethod
+    def from_dataframe(cls, df, lazy: bool = False) -> "list[ITTicket] | LazyModelList":
+        """Build tickets column-wise from a DataFrame with the CSV columns.
+        With lazy=True each object is only created when it is first accessed.
+        """
+        columns = [df['id'].astype(int).tolist(), df['title'].astype(str).tolist(), df['priority'].astype(str).tolist(),
+                   df['status'].astype(str).tolist(), df['created_date'].astype(str).tolist()]
+        if lazy:
+            return LazyModelList(cls, columns)
+        return cls.from_rows(zip(*columns))
     
     def get_id(self) -> int:
         """Get ticket ID."""
@@ -30,12 +67,11 @@ class ITTicket:
     
     def update_status(self, new_status: str) -> None:
         """Update ticket status."""
-        self.__status = new_status
+        self.__status = STATUSES.intern(new_status)
     
     def get_priority_level(self) -> int:
         """Return an integer priority level for comparison."""
-        mapping = {"low": 1, "medium": 2, "high": 3, "urgent": 4}
-        return mapping.get(self.__priority.lower(), 0)
+        return self.__priority_level
     
     def to_dict(self) -> dict:
         """Convert ticket to dictionary for CSV export."""
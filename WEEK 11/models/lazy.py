@@ -0,0 +1,35 @@
+from collections.abc import Sequence
+from typing import Any, Callable
+
+
+class LazyModelList(Sequence):
+    """Read-only list of model objects built from columns on first access.
+
+    Holds one list per constructor argument; an object is only created when
+    its index is read, and is then kept for later reads.
+    """
+
+    def __init__(self, factory: Callable[..., Any], columns: list[list]):
+        self._factory = factory
+        self._columns = columns
+        self._built: dict[int, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._columns[0]) if self._columns else 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("LazyModelList index out of range")
+        item = self._built.get(index)
+        if item is None:
+            item = self._factory(*(column[index] for column in self._columns))
+            self._built[index] = item
+        return item
+
+    def built_count(self) -> int:
+        """Number of objects created so far."""
+        return len(self._built)
@@ -1,15 +1,53 @@
+from itertools import starmap
+from typing import Iterable
+
+from models.lazy import LazyModelList
+from models.vocabulary import get_vocabulary
+
+# Severity -> rank, also stored as the indexed severity_rank column (migration 5)
+SEVERITY_RANKS = {"low": 1, "medium": 2, "high": 3, "critical": 4}
+
+# Shared interned values for the low-cardinality fields
+INCIDENT_TYPES = get_vocabulary("incident_type")
+SEVERITIES = get_vocabulary("severity")
+STATUSES = get_vocabulary("status")
+
+
 class SecurityIncident:
     """Represents a cybersecurity incident in the platform."""
     
+    # Fixed attribute slots instead of a per-instance __dict__
+    __slots__ = ("__id", "__date", "__incident_type", "__severity", "__status", "__description", "__reported_by",
+                 "__severity_level")
+    
     def __init__(self, incident_id: int, date: str, incident_type: str, severity: str, 
-                 status: str, description: str, reported_by: str):
+                 status: str, description: str, reported_by: str, severity_level: int | None = None):
         self.__id = incident_id
         self.__date = date
-        self.__incident_type = incident_type
-        self.__severity = severity
-        self.__status = status
+        self.__incident_type = INCIDENT_TYPES.intern(incident_type)
+        self.__severity = SEVERITIES.intern(severity)
+        self.__status = STATUSES.intern(status)
         self.__description = description
         self.__reported_by = reported_by
+        # Rank read from the database when available, otherwise computed once here
+        self.__severity_level = severity_level if severity_level is not None else SEVERITY_RANKS.get(severity.lower(), 0)
+    
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple]) -> list["SecurityIncident"]:
+        """Build incidents from (id, date, incident_type, severity, status, description, reported_by) tuples."""
+        return list(starmap(cls, rows))
+    
+    @classmethod
+    def from_dataframe(cls, df, lazy: bool = False) -> "list[SecurityIncident] | LazyModelList":
+        """Build incidents column-wise from a DataFrame with the CSV columns.
+        With lazy=True each object is only created when it is first accessed.
+        """
+        columns = [df['id'].astype(int).tolist(), df['date'].astype(str).tolist(), df['incident_type'].astype(str).tolist(),
+                   df['severity'].astype(str).tolist(), df['status'].astype(str).tolist(),
+                   df['description'].astype(str).tolist(), df['reported_by'].astype(str).tolist()]
+        if lazy:
+            return LazyModelList(cls, columns)
+        return cls.from_rows(zip(*columns))
     
     def get_id(self) -> int:
         """Get incident ID."""
@@ -41,12 +79,11 @@ class SecurityIncident:
     
     def update_status(self, new_status: str) -> None:
         """Update the status of the incident."""
-        self.__status = new_status
+        self.__status = STATUSES.intern(new_status)
     
     def get_severity_level(self) -> int:
         """Return an integer severity level for comparison."""
-        mapping = {"low": 1, "medium": 2, "high": 3, "critical": 4}
-        return mapping.get(self.__severity.lower(), 0)
+        return self.__severity_level
     
     def to_dict(self) -> dict:
         """Convert incident to dictionary for CSV export."""
@@ -56,9 +93,9 @@ class SecurityIncident:
             'incident_type': self.__incident_type,
             'severity': self.__severity,
             'status': self.__status,
-            'description': self.__description,
+            'description': self.get_description(),
             'reported_by': self.__reported_by
         }
     
     def __str__(self) -> str:
-        return f"Incident {self.__id} [{self.__severity.upper()}] - {self.__status}: {self.__description}"
+        return f"Incident {self.__id} [{self.__severity.upper()}] - {self.__status}: {self.get_description()}"
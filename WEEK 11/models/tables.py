@@ -0,0 +1,187 @@
+from typing import Any, Iterable
+
+import numpy as np
+
+from models.dataset import Dataset
+from models.it_ticket import ITTicket
+from models.security_incident import SecurityIncident
+
+
+class ModelTable:
+    """Columnar collection of records: one NumPy array per field.
+
+    Low-cardinality text fields are stored as integer codes into a sorted array
+    of categories. Model objects are only built for the rows that are read.
+    """
+
+    model: type = object
+    fields: tuple[str, ...] = ()  # the model's constructor argument order
+    categorical: tuple[str, ...] = ()
+    numeric: dict[str, type] = {}
+
+    def __init__(self, columns: dict[str, np.ndarray], categories: dict[str, np.ndarray]):
+        self._columns = columns
+        self._categories = categories
+
+    @classmethod
+    def _encode(cls, field: str, data: Iterable) -> tuple[np.ndarray, np.ndarray | None]:
+        """Convert one field's values to its column array (and categories, if categorical)."""
+        if field in cls.categorical:
+            categories, codes = np.unique(np.asarray(data, dtype=str), return_inverse=True)
+            return codes.astype(np.int32), categories
+        if field in cls.numeric:
+            return np.asarray(data, dtype=cls.numeric[field]), None
+        return np.asarray(data, dtype=object), None
+
+    @classmethod
+    def from_columns(cls, **values: Iterable) -> "ModelTable":
+        """Build a table from one sequence per field."""
+        columns, categories = {}, {}
+        for field in cls.fields:
+            columns[field], field_categories = cls._encode(field, values[field])
+            if field_categories is not None:
+                categories[field] = field_categories
+        return cls(columns, categories)
+
+    @classmethod
+    def from_dataframe(cls, frame) -> "ModelTable":
+        """Build a table from a DataFrame with one column per field.
+        Pandas categorical columns keep their codes instead of being re-encoded.
+        """
+        columns, categories = {}, {}
+        for field in cls.fields:
+            series = frame[field]
+            if field in cls.categorical and str(series.dtype) == "category" and not series.isna().any():
+                categories[field] = np.asarray(series.cat.categories, dtype=str)
+                columns[field] = series.cat.codes.to_numpy(dtype=np.int32)
+                continue
+            columns[field], field_categories = cls._encode(field, series.to_numpy())
+            if field_categories is not None:
+                categories[field] = field_categories
+        return cls(columns, categories)
+
+    @classmethod
+    def from_models(cls, models: Iterable) -> "ModelTable":
+        """Build a table from model objects via their to_dict()."""
+        rows = [model.to_dict() for model in models]
+        return cls.from_columns(**{field: [row[field] for row in rows] for field in cls.fields})
+
+    def __len__(self) -> int:
+        return len(self._columns[self.fields[0]])
+
+    def _subset(self, index) -> "ModelTable":
+        """Return the rows selected by a boolean mask or index array."""
+        return type(self)({field: values[index] for field, values in self._columns.items()}, self._categories)
+
+    def column(self, field: str) -> np.ndarray:
+        """Get a field's values, decoding categorical codes."""
+        if field in self._categories:
+            return self._categories[field][self._columns[field]]
+        return self._columns[field]
+
+    def values(self, field: str) -> list:
+        """Get the sorted distinct values present in a field."""
+        if field in self._categories:
+            return self._categories[field][np.unique(self._columns[field])].tolist()
+        return np.unique(self._columns[field]).tolist()
+
+    def filter(self, mask: np.ndarray | None = None, **equals: Any) -> "ModelTable":
+        """Return the rows matching a boolean mask and every `field=value` (None is ignored)."""
+        keep = np.ones(len(self), dtype=bool) if mask is None else np.asarray(mask, dtype=bool)
+        for field, value in equals.items():
+            if value is None:
+                continue
+            if field in self._categories:
+                categories = self._categories[field]
+                code = np.searchsorted(categories, value)
+                if code == len(categories) or categories[code] != value:
+                    return self._subset(np.zeros(len(self), dtype=bool))
+                keep &= self._columns[field] == code
+            else:
+                keep &= self._columns[field] == value
+        return self._subset(keep)
+
+    def count_by(self, field: str) -> dict:
+        """Return {value: count} for one field, largest first."""
+        if field in self._categories:
+            counts = np.bincount(self._columns[field], minlength=len(self._categories[field]))
+            values = self._categories[field]
+        else:
+            values, counts = np.unique(self._columns[field], return_counts=True)
+        order = np.argsort(-counts, kind="stable")
+        return {values[i].item(): int(counts[i]) for i in order if counts[i] > 0}
+
+    def crosstab(self, row: str, col: str) -> dict:
+        """Return {row_value: {col_value: count}} for two categorical fields."""
+        width = len(self._categories[col])
+        combined = self._columns[row].astype(np.int64) * width + self._columns[col]
+        counts = np.bincount(combined, minlength=len(self._categories[row]) * width)
+        table: dict = {}
+        for code in np.flatnonzero(counts):
+            row_value = self._categories[row][code // width].item()
+            table.setdefault(row_value, {})[self._categories[col][code % width].item()] = int(counts[code])
+        return table
+
+    def top_k(self, field: str, k: int, largest: bool = True) -> "ModelTable":
+        """Return the k rows with the largest (or smallest) values of a numeric field, in order."""
+        # Rank by -value (or value) so the rows wanted come first in ascending order
+        keys = -self._columns[field] if largest else self._columns[field]
+        candidates = np.argpartition(keys, k)[:k] if k < len(self) else np.arange(len(self))
+        return self._subset(candidates[np.argsort(keys[candidates], kind="stable")])
+
+    def sum(self, field: str) -> float:
+        """Sum a numeric field."""
+        return self._columns[field].sum().item()
+
+    def mean(self, field: str) -> float:
+        """Average a numeric field (0.0 when empty)."""
+        return self._columns[field].mean().item() if len(self) else 0.0
+
+    def max(self, field: str) -> float:
+        """Largest value of a numeric field."""
+        return self._columns[field].max().item()
+
+    def min(self, field: str) -> float:
+        """Smallest value of a numeric field."""
+        return self._columns[field].min().item()
+
+    def _value(self, field: str, index: int) -> Any:
+        value = self._columns[field][index]
+        if field in self._categories:
+            value = self._categories[field][value]
+        return value.item() if isinstance(value, np.generic) else value
+
+    def row(self, index: int) -> Any:
+        """Build the model object for one row."""
+        return self.model(*(self._value(field, index) for field in self.fields))
+
+    def to_models(self, start: int = 0, stop: int | None = None) -> list:
+        """Build model objects for a range of rows, e.g. the page being displayed."""
+        return [self.row(i) for i in range(*slice(start, stop).indices(len(self)))]
+
+
+class IncidentTable(ModelTable):
+    """Columnar security incidents."""
+
+    model = SecurityIncident
+    fields = ("id", "date", "incident_type", "severity", "status", "description", "reported_by")
+    categorical = ("incident_type", "severity", "status")
+    numeric = {"id": np.int64}
+
+
+class TicketTable(ModelTable):
+    """Columnar IT tickets."""
+
+    model = ITTicket
+    fields = ("id", "title", "priority", "status", "created_date")
+    categorical = ("priority", "status")
+    numeric = {"id": np.int64}
+
+
+class DatasetTable(ModelTable):
+    """Columnar dataset metadata; size is in KB."""
+
+    model = Dataset
+    fields = ("id", "name", "source", "category", "size")
+    categorical = ("source", "category")
+    numeric = {"id": np.int64, "size": np.int64}
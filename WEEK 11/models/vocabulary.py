@@ -0,0 +1,92 @@
+import sys
+import threading
+
+
+class Vocabulary:
+    """Interned values of one low-cardinality field, each with a small integer code.
+
+    Every model holding the same severity, status, etc. shares one string object
+    instead of its own copy read from SQLite or a CSV. Vocabularies are process-wide
+    and never shrink, so each one stops growing at `max_size` values: later new
+    values are returned as-is (not shared) and have no code.
+    """
+
+    MAX_SIZE = 256
+
+    def __init__(self, name: str, max_size: int = MAX_SIZE):
+        self._name = name
+        self._max_size = max_size
+        self._canonical: dict[str, str] = {}
+        self._codes: dict[str, int] = {}
+        self._values: list[str] = []
+        self._lock = threading.Lock()
+
+    def get_name(self) -> str:
+        """Get the field name this vocabulary is for."""
+        return self._name
+
+    def _add(self, value: str) -> str:
+        with self._lock:
+            # Another thread may have added it while we waited
+            canonical = self._canonical.get(value)
+            if canonical is None:
+                if len(self._values) >= self._max_size:
+                    return value  # full: a high-cardinality field should not be interned
+                canonical = sys.intern(str(value))
+                self._codes[canonical] = len(self._values)
+                self._values.append(canonical)
+                self._canonical[canonical] = canonical
+            return canonical
+
+    def intern(self, value: str | None) -> str | None:
+        """Return the shared copy of a value, adding it on first sight."""
+        if value is None:
+            return None
+        canonical = self._canonical.get(value)
+        return canonical if canonical is not None else self._add(value)
+
+    def intern_many(self, values: list) -> list:
+        """Intern a whole column, e.g. before building models from it."""
+        intern = self.intern
+        return [intern(value) for value in values]
+
+    def code(self, value: str) -> int:
+        """Return the integer code of a value, adding it on first sight.
+        Raises ValueError once the vocabulary is full and the value is new.
+        """
+        code = self._codes.get(self.intern(value))
+        if code is None:
+            raise ValueError(f"Vocabulary {self._name!r} is full ({self._max_size} values)")
+        return code
+
+    def codes(self, values: list) -> list[int]:
+        """Encode a whole column as integer codes."""
+        return [self.code(value) for value in values]
+
+    def value(self, code: int) -> str:
+        """Return the value for an integer code."""
+        return self._values[code]
+
+    def get_values(self) -> list[str]:
+        """Get every value in code order."""
+        return list(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._canonical
+
+
+_vocabularies: dict[str, Vocabulary] = {}
+_vocabularies_lock = threading.Lock()
+
+
+def get_vocabulary(name: str) -> Vocabulary:
+    """Return the process-wide vocabulary for a field name, creating it on first use."""
+    with _vocabularies_lock:
+        vocabulary = _vocabularies.get(name)
+        if vocabulary is None:
+            vocabulary = Vocabulary(name)
+            _vocabularies[name] = vocabulary
+        return vocabulary
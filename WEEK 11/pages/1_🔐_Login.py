@@ -8,7 +8,7 @@ st.title(" Login")
 st.markdown("---")
 
 # Initialize database and auth
-db = DatabaseManager("database/platform.db")
+db = DatabaseManager("database/platform.db", pooled=True)
 auth = AuthManager(db)
 
 # Create tabs for Login and Register
@@ -1,13 +1,15 @@
 import streamlit as st
-import pandas as pd
 import plotly.express as px
 import os, sys
+import tempfile
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
 # Import service classes and models
 from services.database_manager import DatabaseManager
-from models.security_incident import SecurityIncident
+from services.kpi_counters import KpiCounters
+from services.repositories import IncidentRepository
+from database.migrations import ensure_migrated
 
 st.set_page_config(page_title="Cybersecurity", page_icon="🛡️", layout="wide")
 st.title("Cybersecurity Management")
@@ -19,14 +21,19 @@ if st.session_state.get("current_user") is None:
     st.stop()
 
 # Initialize DatabaseManager
-db = DatabaseManager("database/platform.db")
+ensure_migrated("database/platform.db")
+db = DatabaseManager("database/platform.db", pooled=True, cached=True, snapshot=True)
 db.connect()
+kpis = KpiCounters(db)
+incidents = IncidentRepository(db)
+
+
+def export_incidents_csv() -> str:
+    """Stream every incident from the cursor into a temporary CSV file and return its path."""
+    with tempfile.NamedTemporaryFile("w", newline="", suffix=".csv", delete=False, encoding="utf-8") as f:
+        db.write_csv(f, *incidents.full_query().order_by("id", descending=True).to_sql())
+    return f.name
 
-# Helper function to load incidents as SecurityIncident objects
-def load_incidents():
-    """Load incidents from database and wrap them in SecurityIncident objects."""
-    rows = db.fetch_all("SELECT id, incident_type, severity, status, description FROM security_incidents ORDER BY id DESC")
-    return [SecurityIncident(row[0], "", row[1], row[2], row[3], row[4], "") for row in rows]
 
 # Create tabs
 tab1, tab2, tab3 = st.tabs(["Dashboard", "View Incidents", "Add Incident"])
@@ -35,42 +42,34 @@ with tab1:
     st.subheader("Security Dashboard Overview")
     
     try:
-        incidents = load_incidents()
+        # Trigger-maintained counters: lookups cost the same at any table size
+        severity_counts = kpis.counts("security_incidents", "severity")
+        status_counts = kpis.counts("security_incidents", "status")
+        type_counts = kpis.counts("security_incidents", "incident_type")
+        total_incidents = kpis.count("security_incidents")
         
-        if len(incidents) > 0:
-            # Using object methods to calculate metrics
+        if total_incidents > 0:
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                st.metric("Total Incidents", len(incidents))
+                st.metric("Total Incidents", total_incidents)
             
             with col2:
-                # Using get_severity() method from SecurityIncident
-                critical_count = sum(1 for inc in incidents if inc.get_severity() == 'critical')
-                st.metric("Critical", critical_count)
+                st.metric("Critical", severity_counts.get('critical', 0))
             
             with col3:
-                # Using get_status() method from SecurityIncident
-                open_count = sum(1 for inc in incidents if inc.get_status() == 'Open')
-                st.metric("Open", open_count)
+                st.metric("Open", status_counts.get('Open', 0))
             
             with col4:
-                resolved_count = sum(1 for inc in incidents if inc.get_status() == 'Resolved')
-                st.metric("Resolved", resolved_count)
+                st.metric("Resolved", status_counts.get('Resolved', 0))
             
             st.markdown("---")
             
-            # Visualizations using object methods
+            # Visualizations from the aggregate rows
             col_left, col_right = st.columns(2)
             
             with col_left:
                 st.subheader("Incidents by Severity")
-                # Using get_severity() method
-                severity_counts = {}
-                for incident in incidents:
-                    severity = incident.get_severity()
-                    severity_counts[severity] = severity_counts.get(severity, 0) + 1
-                
                 fig1 = px.pie(
                     names=list(severity_counts.keys()),
                     values=list(severity_counts.values()),
@@ -79,12 +78,6 @@ with tab1:
                 st.plotly_chart(fig1, use_container_width=True)
                 
                 st.subheader("Incidents by Type")
-                # Using get_incident_type() method
-                type_counts = {}
-                for incident in incidents:
-                    inc_type = incident.get_incident_type()
-                    type_counts[inc_type] = type_counts.get(inc_type, 0) + 1
-                
                 fig3 = px.bar(
                     x=list(type_counts.keys()),
                     y=list(type_counts.values()),
@@ -94,11 +87,6 @@ with tab1:
             
             with col_right:
                 st.subheader("Incidents by Status")
-                status_counts = {}
-                for incident in incidents:
-                    status = incident.get_status()
-                    status_counts[status] = status_counts.get(status, 0) + 1
-                
                 fig2 = px.bar(
                     x=list(status_counts.keys()),
                     y=list(status_counts.values()),
@@ -109,7 +97,10 @@ with tab1:
                 st.subheader("Severity Levels")
                 # Using get_severity_level() method to show numeric levels
                 st.write("**Risk Assessment:**")
-                for incident in incidents[:5]:  # Show top 5
+                # Most severe unresolved first, read in order from the severity_rank index
+                most_severe = (incidents.query().where("status", "!=", "Resolved")
+                               .order_by("severity_rank", descending=True).then_by("id").limit(5))
+                for incident in incidents.find(most_severe):  # Show top 5
                     severity_level = incident.get_severity_level()
                     st.write(f"- {incident.get_incident_type()}: Level {severity_level}/4")
         else:
@@ -122,36 +113,78 @@ with tab2:
     st.subheader("Security Incidents List")
     
     try:
-        incidents = load_incidents()
-        
-        if len(incidents) > 0:
-            # Filters using object methods
-            all_severities = sorted(set(inc.get_severity() for inc in incidents))
-            all_statuses = sorted(set(inc.get_status() for inc in incidents))
-            all_types = sorted(set(inc.get_incident_type() for inc in incidents))
+        if kpis.count("security_incidents") > 0:
+            # Filter options come from the KPI counters, so no incident rows are read for them
+            all_severities = sorted(kpis.counts("security_incidents", "severity"))
+            all_statuses = sorted(kpis.counts("security_incidents", "status"))
+            all_types = sorted(kpis.counts("security_incidents", "incident_type"))
             
-            col1, col2, col3 = st.columns(3)
+            search_text = st.text_input("Search descriptions", placeholder="e.g. ransom, login attempts")
+            
+            col1, col2, col3, col4 = st.columns(4)
             with col1:
                 severity_filter = st.selectbox("Filter by Severity", ["All"] + all_severities)
             with col2:
                 status_filter = st.selectbox("Filter by Status", ["All"] + all_statuses)
             with col3:
                 type_filter = st.selectbox("Filter by Type", ["All"] + all_types)
+            with col4:
+                page_size = st.selectbox("Page size", [10, 25, 50, 100], key="incident_page_size")
+            
+            # Filters compile to a parameterized WHERE clause; "All" adds no condition
+            query = incidents.query().filter(
+                severity=None if severity_filter == "All" else severity_filter,
+                status=None if status_filter == "All" else status_filter,
+                incident_type=None if type_filter == "All" else type_filter,
+            )
             
-            # Apply filters using object methods
-            filtered_incidents = incidents
-            if severity_filter != "All":
-                filtered_incidents = [inc for inc in filtered_incidents if inc.get_severity() == severity_filter]
-            if status_filter != "All":
-                filtered_incidents = [inc for inc in filtered_incidents if inc.get_status() == status_filter]
-            if type_filter != "All":
-                filtered_incidents = [inc for inc in filtered_incidents if inc.get_incident_type() == type_filter]
+            # Go back to the first page whenever the filters or page size change
+            view_key = (severity_filter, status_filter, type_filter, page_size)
+            if st.session_state.get("incident_view_key") != view_key:
+                st.session_state.incident_view_key = view_key
+                st.session_state.incident_cursor = (None, None)
+            after, before = st.session_state.incident_cursor
+            
+            # Only one page of rows is fetched, seeking by id; the total comes from the
+            # counters unless the filters combine in a way they do not track
+            filters = {"severity": severity_filter, "status": status_filter, "incident_type": type_filter}
+            active = {dimension: value for dimension, value in filters.items() if value != "All"}
+            if not active:
+                total = kpis.count("security_incidents")
+            elif len(active) == 1 or set(active) == {"severity", "status"}:
+                dimension = "|".join(active)
+                total = kpis.count("security_incidents", dimension, "|".join(active.values()))
+            else:
+                total = None
+            if search_text.strip():
+                # Ranked FTS5 matches within the current filters, with highlighted snippets
+                results = incidents.search(search_text, query.limit(page_size))
+                page = None
+                page_incidents = [incident for incident, _ in results]
+                snippets = {incident.get_id(): snippet for incident, snippet in results}
+                st.write(f"Top {len(page_incidents)} match(es) for \"{search_text}\"")
+            else:
+                page = incidents.find_page(query, page_size, after=after, before=before)
+                page_incidents = page.get_items()
+                snippets = {}
+                st.write(f"Showing {len(page_incidents)} of {total if total is not None else incidents.count(query)} incident(s)")
             
-            st.write(f"Showing {len(filtered_incidents)} incident(s)")
+            # The export scans the whole table, so it is only built on request; rows go
+            # from the cursor to a temporary file instead of being held in memory
+            if st.button("Prepare CSV export"):
+                previous = st.session_state.get("incident_export")
+                if previous and os.path.exists(previous):
+                    os.remove(previous)
+                st.session_state.incident_export = export_incidents_csv()
+            export_path = st.session_state.get("incident_export")
+            if export_path and os.path.exists(export_path):
+                with open(export_path, "rb") as export_file:
+                    st.download_button("Download Incidents as CSV", export_file,
+                                       file_name="security_incidents.csv", mime="text/csv")
             st.markdown("---")
             
             # Display incidents using object methods
-            for incident in filtered_incidents:
+            for incident in page_incidents:
                 with st.container(border=True):
                     col1, col2, col3 = st.columns([3, 1, 1])
                     
@@ -159,7 +192,7 @@ with tab2:
                         # Using __str__() method for display
                         st.write(f"### Incident #{incident.get_id()}")
                         st.write(f"**Type:** {incident.get_incident_type()}")
-                        st.write(f"**Description:** {incident.get_description()}")
+                        st.write(f"**Description:** {snippets.get(incident.get_id(), incident.get_description())}")
                         st.write(f"**Severity Level:** {incident.get_severity_level()}/4")
                     
                     with col2:
@@ -215,6 +248,15 @@ with tab2:
                                 if st.form_submit_button("Cancel"):
                                     st.session_state[f'edit_mode_{incident.get_id()}'] = False
                                     st.rerun()
+            
+            if page is not None:
+                col_prev, col_next = st.columns(2)
+                if page.has_previous() and col_prev.button("Previous", key="incident_prev"):
+                    st.session_state.incident_cursor = (None, page.get_first_key())
+                    st.rerun()
+                if page.has_next() and col_next.button("Next", key="incident_next"):
+                    st.session_state.incident_cursor = (page.get_last_key(), None)
+                    st.rerun()
         else:
             st.info("No incidents found. Add incidents from the 'Add Incident' tab.")
     
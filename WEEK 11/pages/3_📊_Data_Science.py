@@ -5,6 +5,8 @@ import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from models.dataset import Dataset
+from models.tables import DatasetTable
+from services.data_files import read_data_file
 
 st.set_page_config(page_title="Data Science", page_icon="📊", layout="wide")
 st.title("Data Science & Analytics")
@@ -20,20 +22,14 @@ CSV_FILE = "files/datasets_metadata.csv"
 def load_data():
     """Load datasets from CSV and return list of Dataset objects."""
     if os.path.exists(CSV_FILE):
-        df = pd.read_csv(CSV_FILE)
-        datasets = []
-        for _, row in df.iterrows():
-            dataset = Dataset(
-                dataset_id=int(row['id']),
-                name=str(row['name']),
-                source=str(row['source']),
-                category=str(row['category']),
-                size=int(row['size'])
-            )
-            datasets.append(dataset)
-        return datasets
+        return Dataset.from_dataframe(read_data_file(CSV_FILE))
     return []
 
+@st.cache_resource(max_entries=1)
+def load_table(csv_mtime: float):
+    """Columnar copy of the datasets for the analytics tab, built once per CSV version."""
+    return DatasetTable.from_dataframe(read_data_file(CSV_FILE))
+
 def save_data(datasets: list):
     """Save list of Dataset objects to CSV."""
     data = [ds.to_dict() for ds in datasets]
@@ -122,14 +118,16 @@ with tab2:
 with tab3:
     st.subheader("Dataset Analytics")
     if len(datasets) > 0:
+        # Vectorized over NumPy columns instead of looping over Dataset objects
+        table = load_table(os.path.getmtime(CSV_FILE))
         col1, col2, col3 = st.columns(3)
-        total_size = sum(ds.calculate_size_mb() for ds in datasets)
-        avg_size = total_size / len(datasets)
-        max_size = max(ds.calculate_size_mb() for ds in datasets)
-        min_size = min(ds.calculate_size_mb() for ds in datasets)
-        categories = len(set(ds.get_category() for ds in datasets))
+        total_size = table.sum("size") / 1024
+        avg_size = table.mean("size") / 1024
+        max_size = table.max("size") / 1024
+        min_size = table.min("size") / 1024
+        categories = len(table.count_by("category"))
         
-        col1.metric("Total Datasets", len(datasets))
+        col1.metric("Total Datasets", len(table))
         col1.metric("Total Size", f"{total_size:.2f} MB")
         col2.metric("Avg Size", f"{avg_size:.2f} MB")
         col2.metric("Largest Dataset", f"{max_size:.2f} MB")
@@ -141,41 +139,28 @@ with tab3:
         
         with col_left:
             st.subheader("Dataset Sizes")
-            size_data = {ds.get_name(): ds.calculate_size_mb() for ds in datasets}
-            fig1 = px.bar(x=list(size_data.keys()), y=list(size_data.values()), title='Dataset Sizes (MB)')
+            fig1 = px.bar(x=table.column("name"), y=table.column("size") / 1024, title='Dataset Sizes (MB)')
             fig1.update_layout(xaxis_tickangle=-45)
             st.plotly_chart(fig1, use_container_width=True)
             
             st.subheader("Data Sources")
-            source_data = {}
-            for ds in datasets:
-                source_data[ds.get_source()] = source_data.get(ds.get_source(), 0) + 1
+            source_data = table.count_by("source")
             fig2 = px.pie(names=list(source_data.keys()), values=list(source_data.values()), title='Datasets by Source')
             st.plotly_chart(fig2, use_container_width=True)
         
         with col_right:
             st.subheader("Category Distribution")
-            cat_data = {}
-            for ds in datasets:
-                cat_data[ds.get_category()] = cat_data.get(ds.get_category(), 0) + 1
+            cat_data = table.count_by("category")
             fig3 = px.bar(x=list(cat_data.keys()), y=list(cat_data.values()), title='Datasets by Category')
             st.plotly_chart(fig3, use_container_width=True)
             
             st.subheader("Dataset Details")
-            detail_data = [[ds.get_name(), ds.get_source(), ds.get_category(), f"{ds.calculate_size_mb():.2f}"] for ds in datasets[:10]]
+            detail_data = [[ds.get_name(), ds.get_source(), ds.get_category(), f"{ds.calculate_size_mb():.2f}"] for ds in table.to_models(0, 10)]
             st.dataframe(pd.DataFrame(detail_data, columns=['Name', 'Source', 'Category', 'Size (MB)']), use_container_width=True, hide_index=True)
         
         st.markdown("---")
         st.subheader("Category vs Source Breakdown")
-        cat_source = {}
-        for ds in datasets:
-            key = (ds.get_category(), ds.get_source())
-            cat_source[key] = cat_source.get(key, 0) + 1
-        crosstab_data = {}
-        for (cat, src), count in cat_source.items():
-            if cat not in crosstab_data:
-                crosstab_data[cat] = {}
-            crosstab_data[cat][src] = count
+        crosstab_data = table.crosstab("category", "source")
         st.dataframe(pd.DataFrame(crosstab_data).fillna(0).astype(int), use_container_width=True)
         
         csv_data = pd.DataFrame([ds.to_dict() for ds in datasets]).to_csv(index=False)
@@ -4,8 +4,14 @@ import plotly.express as px
 from datetime import datetime
 import os
 import sys
+import threading
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from models.it_ticket import ITTicket
+from models.tables import TicketTable
+from services.data_files import read_data_file
+from services.pagination import paginate_list
+from services.search_index import TextSearchIndex
+from services.time_rollups import TimeRollup
 
 st.set_page_config(page_title="IT Operations", page_icon="💻", layout="wide")
 st.title("IT Operations & Support")
@@ -21,25 +27,65 @@ CSV_FILE = "files/it_tickets.csv"
 def load_data():
     """Load tickets from CSV and return list of ITTicket objects."""
     if os.path.exists(CSV_FILE):
-        df = pd.read_csv(CSV_FILE)
-        tickets = []
-        for _, row in df.iterrows():
-            ticket = ITTicket(
-                ticket_id=int(row['id']),
-                title=str(row['title']),
-                priority=str(row['priority']),
-                status=str(row['status']),
-                created_date=str(row['created_date'])
-            )
-            tickets.append(ticket)
-        return tickets
+        return ITTicket.from_dataframe(read_data_file(CSV_FILE))
     return []
 
+@st.cache_resource(max_entries=1)
+def load_search_index(csv_mtime: float):
+    """Build an in-memory FTS5 index over ticket titles; rebuilt when the CSV changes."""
+    return TextSearchIndex((t.get_id(), t.get_title()) for t in load_data())
+
+@st.cache_resource
+def ticket_rollup_state() -> dict:
+    """Process-wide ticket rollup, the CSV mtime it reflects, and the lock that
+    serializes changes to it across sessions.
+    """
+    return {"rollup": None, "mtime": None, "lock": threading.Lock()}
+
+def rollup_values(ticket: ITTicket) -> dict:
+    """The rollup dimension values of one ticket."""
+    return {"priority": ticket.get_priority(), "status": ticket.get_status()}
+
+def ticket_totals(grain: str) -> dict:
+    """Ticket counts per period. The create/edit/delete handlers keep the rollup
+    current; it is only rebuilt from every ticket if the CSV was changed elsewhere.
+    """
+    state = ticket_rollup_state()
+    with state["lock"]:
+        mtime = os.path.getmtime(CSV_FILE)
+        if state["rollup"] is None or state["mtime"] != mtime:
+            rollup = TimeRollup(["priority", "status"])
+            for t in load_data():
+                rollup.add(t.get_created_date(), **rollup_values(t))
+            state["rollup"], state["mtime"] = rollup, mtime
+        return state["rollup"].totals(grain)
+
+def update_rollup(change) -> None:
+    """Apply one ticket change to the rollup, if it has been built."""
+    state = ticket_rollup_state()
+    with state["lock"]:
+        if state["rollup"] is not None:
+            change(state["rollup"])
+
+@st.cache_resource(max_entries=1)
+def load_table(csv_mtime: float):
+    """Columnar copy of the tickets for the analytics tab, built once per CSV version."""
+    return TicketTable.from_dataframe(read_data_file(CSV_FILE))
+
 def save_data(tickets: list):
     """Save list of ITTicket objects to CSV."""
     data = [ticket.to_dict() for ticket in tickets]
     df = pd.DataFrame(data)
-    df.to_csv(CSV_FILE, index=False)
+    state = ticket_rollup_state()
+    with state["lock"]:
+        previous_mtime = os.path.getmtime(CSV_FILE) if os.path.exists(CSV_FILE) else None
+        df.to_csv(CSV_FILE, index=False)
+        # The handler already applied this change; the rollup is only current if it
+        # matched the file as it was before this write, otherwise rebuild it
+        if state["rollup"] is not None and state["mtime"] == previous_mtime:
+            state["mtime"] = os.path.getmtime(CSV_FILE)
+        else:
+            state["rollup"] = None
     st.cache_data.clear()
 
 tickets = load_data()
@@ -51,9 +97,12 @@ with tab1:
         all_statuses = sorted(set(t.get_status() for t in tickets))
         all_priorities = sorted(set(t.get_priority() for t in tickets))
         
-        col1, col2 = st.columns(2)
+        search_text = st.text_input("Search titles", placeholder="e.g. vpn, password reset")
+        
+        col1, col2, col3 = st.columns(3)
         status_filter = col1.selectbox("Filter by Status", ["All"] + all_statuses)
         priority_filter = col2.selectbox("Filter by Priority", ["All"] + all_priorities)
+        page_size = col3.selectbox("Page size", [10, 25, 50, 100], key="ticket_page_size")
         
         filtered = tickets
         if status_filter != "All":
@@ -61,19 +110,40 @@ with tab1:
         if priority_filter != "All":
             filtered = [t for t in filtered if t.get_priority() == priority_filter]
         
-        st.write(f"Showing {len(filtered)} ticket(s)")
+        snippets = {}
+        page_key = lambda t: t.get_id()
+        if search_text.strip():
+            # Ranked title matches; pages then seek by rank position instead of id
+            hits = load_search_index(os.path.getmtime(CSV_FILE)).search(search_text)
+            rank = {ticket_id: position for position, (ticket_id, _) in enumerate(hits)}
+            snippets = dict(hits)
+            filtered = sorted((t for t in filtered if t.get_id() in rank), key=lambda t: rank[t.get_id()])
+            page_key = lambda t: rank[t.get_id()]
+        
+        # Go back to the first page whenever the search, filters or page size change
+        view_key = (search_text, status_filter, priority_filter, page_size)
+        if st.session_state.get("ticket_view_key") != view_key:
+            st.session_state.ticket_view_key = view_key
+            st.session_state.ticket_cursor = (None, None)
+        after, before = st.session_state.ticket_cursor
+        
+        # Tickets are stored in id order, so seek by id and render one page only
+        page = paginate_list(filtered, key=page_key, page_size=page_size, after=after, before=before)
+        
+        st.write(f"Showing {len(page.get_items())} of {len(filtered)} ticket(s)")
         st.markdown("---")
         
-        for ticket in filtered:
+        for ticket in page.get_items():
             with st.container(border=True):
                 col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
-                col1.write(f"### Ticket #{ticket.get_id()}\n**{ticket.get_title()}**\nCreated: {ticket.get_created_date()}")
+                col1.write(f"### Ticket #{ticket.get_id()}\n{snippets.get(ticket.get_id(), f'**{ticket.get_title()}**')}\nCreated: {ticket.get_created_date()}")
                 col2.write(f"**{ticket.get_priority().upper()}**")
                 col3.write(f"**{ticket.get_status().upper()}**")
                 if col4.button("Edit", key=f"edit_{ticket.get_id()}"):
                     st.session_state[f'edit_mode_{ticket.get_id()}'] = True
                 if col4.button("Delete", key=f"delete_{ticket.get_id()}"):
                     tickets.remove(ticket)
+                    update_rollup(lambda rollup: rollup.remove(ticket.get_created_date(), **rollup_values(ticket)))
                     save_data(tickets)
                     st.success("Deleted!")
                     st.rerun()
@@ -90,6 +160,8 @@ with tab1:
                         if col_a.form_submit_button("Save"):
                             updated = ITTicket(ticket.get_id(), new_title, new_priority, new_status, ticket.get_created_date())
                             tickets[tickets.index(ticket)] = updated
+                            update_rollup(lambda rollup: rollup.update(ticket.get_created_date(), rollup_values(ticket),
+                                                                       updated.get_created_date(), rollup_values(updated)))
                             save_data(tickets)
                             st.session_state[f'edit_mode_{ticket.get_id()}'] = False
                             st.success("Updated!")
@@ -97,6 +169,14 @@ with tab1:
                         if col_b.form_submit_button("Cancel"):
                             st.session_state[f'edit_mode_{ticket.get_id()}'] = False
                             st.rerun()
+        
+        col_prev, col_next = st.columns(2)
+        if page.has_previous() and col_prev.button("Previous", key="ticket_prev"):
+            st.session_state.ticket_cursor = (None, page.get_first_key())
+            st.rerun()
+        if page.has_next() and col_next.button("Next", key="ticket_next"):
+            st.session_state.ticket_cursor = (page.get_last_key(), None)
+            st.rerun()
     else:
         st.info("No tickets found.")
 
@@ -115,6 +195,7 @@ with tab2:
                 new_id = max([t.get_id() for t in tickets]) + 1 if tickets else 1
                 new_ticket = ITTicket(new_id, ticket_title, priority, 'open', created_date.strftime('%Y-%m-%d'))
                 tickets.append(new_ticket)
+                update_rollup(lambda rollup: rollup.add(new_ticket.get_created_date(), **rollup_values(new_ticket)))
                 save_data(tickets)
                 st.success(f"Ticket #{new_id} '{ticket_title}' created successfully!")
                 st.rerun()
@@ -122,57 +203,47 @@ with tab2:
 with tab3:
     st.subheader("IT Operations Analytics")
     if len(tickets) > 0:
+        # Vectorized over NumPy columns instead of looping over ITTicket objects
+        table = load_table(os.path.getmtime(CSV_FILE))
+        status_data = table.count_by("status")
         col1, col2, col3, col4 = st.columns(4)
-        open_count = sum(1 for t in tickets if t.get_status() == 'open')
-        in_prog = sum(1 for t in tickets if t.get_status() == 'in-progress')
-        resolved = sum(1 for t in tickets if t.get_status() in ['resolved', 'closed'])
+        open_count = status_data.get('open', 0)
+        in_prog = status_data.get('in-progress', 0)
+        resolved = status_data.get('resolved', 0) + status_data.get('closed', 0)
         
-        col1.metric("Total Tickets", len(tickets))
-        col2.metric("Open Tickets", open_count, f"{(open_count/len(tickets)*100):.1f}%")
+        col1.metric("Total Tickets", len(table))
+        col2.metric("Open Tickets", open_count, f"{(open_count/len(table)*100):.1f}%")
         col3.metric("In Progress", in_prog)
-        col4.metric("Resolved/Closed", resolved, f"{(resolved/len(tickets)*100):.1f}%")
+        col4.metric("Resolved/Closed", resolved, f"{(resolved/len(table)*100):.1f}%")
         
         st.markdown("---")
         col_left, col_right = st.columns(2)
         
         with col_left:
             st.subheader("Tickets by Priority")
-            priority_data = {}
-            for t in tickets:
-                priority_data[t.get_priority()] = priority_data.get(t.get_priority(), 0) + 1
+            priority_data = table.count_by("priority")
             fig1 = px.pie(names=list(priority_data.keys()), values=list(priority_data.values()), title='Priority Distribution')
             st.plotly_chart(fig1, use_container_width=True)
             
             st.subheader("Tickets Over Time")
-            df_time = pd.DataFrame([{'date': t.get_created_date()} for t in tickets])
-            df_time['date'] = pd.to_datetime(df_time['date'])
-            trend = df_time.groupby(df_time['date'].dt.to_period('M')).size()
-            fig3 = px.line(x=trend.index.astype(str), y=trend.values, title='Monthly Trend')
+            grain = st.radio("Group by", ["day", "week", "month"], index=2, horizontal=True, key="ticket_grain")
+            trend = ticket_totals(grain)
+            grain_title = {"day": "Daily", "week": "Weekly", "month": "Monthly"}[grain]
+            fig3 = px.line(x=list(trend.keys()), y=list(trend.values()), title=f'{grain_title} Trend')
             st.plotly_chart(fig3, use_container_width=True)
         
         with col_right:
             st.subheader("Tickets by Status")
-            status_data = {}
-            for t in tickets:
-                status_data[t.get_status()] = status_data.get(t.get_status(), 0) + 1
             fig2 = px.bar(x=list(status_data.keys()), y=list(status_data.values()), title='Status Distribution')
             st.plotly_chart(fig2, use_container_width=True)
             
             st.subheader("Priority vs Status Breakdown")
-            ps_data = {}
-            for t in tickets:
-                key = (t.get_priority(), t.get_status())
-                ps_data[key] = ps_data.get(key, 0) + 1
-            crosstab = {}
-            for (pri, sta), cnt in ps_data.items():
-                if pri not in crosstab:
-                    crosstab[pri] = {}
-                crosstab[pri][sta] = cnt
+            crosstab = table.crosstab("priority", "status")
             st.dataframe(pd.DataFrame(crosstab).fillna(0).astype(int), use_container_width=True)
         
         st.markdown("---")
         st.subheader("Complete Ticket List")
-        ticket_data = [[t.get_id(), t.get_title(), t.get_priority(), t.get_status(), t.get_created_date()] for t in sorted(tickets, key=lambda x: x.get_id(), reverse=True)[:20]]
+        ticket_data = [[t.get_id(), t.get_title(), t.get_priority(), t.get_status(), t.get_created_date()] for t in table.top_k("id", 20).to_models()]
         st.dataframe(pd.DataFrame(ticket_data, columns=['ID', 'Title', 'Priority', 'Status', 'Created']), use_container_width=True, hide_index=True)
         
         csv_data = pd.DataFrame([t.to_dict() for t in tickets]).to_csv(index=False)
@@ -1,6 +1,9 @@
 import streamlit as st
 from services.database_manager import DatabaseManager
+from services.platform_stats import get_platform_stats_service
+from services.repositories import IncidentRepository
 from services.ai_assistant import AIAssistant
+from database.migrations import ensure_migrated
 
 st.set_page_config(page_title="AI Assistant", page_icon="🤖", layout="wide")
 st.title("AI Assistant & Chatbot")
@@ -10,7 +13,14 @@ if st.session_state.get("current_user") is None:
     st.error("Please log in first!")
     st.stop()
 
+ensure_migrated("database/platform.db")
+stats_service = get_platform_stats_service("database/platform.db")
+
 ai = AIAssistant()
+ai.set_system_prompt(
+    "You are a helpful assistant for a Multi-Domain Intelligence Platform. "
+    f"Current platform state: {stats_service.get_stats().summary_text()}."
+)
 
 if "messages" not in st.session_state:
     st.session_state.messages = []
@@ -29,27 +39,25 @@ with st.sidebar:
     st.markdown("### Quick Actions")
     
     if st.button("Get Platform Summary"):
-        db = DatabaseManager("database/platform.db")
-        db.connect()
         try:
-            security_count = db.fetch_one("SELECT COUNT(*) FROM security_incidents")[0]
-            dataset_count = db.fetch_one("SELECT COUNT(*) FROM datasets")[0]
-            ticket_count = db.fetch_one("SELECT COUNT(*) FROM it_tickets")[0]
+            # All counters come from one query, shared for a few seconds across sessions
+            platform_stats = stats_service.get_stats()
+            security_count = platform_stats.count("security_incidents")
+            dataset_count = platform_stats.count("datasets")
+            ticket_count = platform_stats.count("it_tickets")
             
             summary = f"**Platform Summary:**\n\nSecurity Incidents: {security_count}\nDatasets: {dataset_count}\nIT Tickets: {ticket_count}\n"
+            summary += f"\n_As of {platform_stats.get_age():.0f}s ago_"
             st.session_state.messages.append({"role": "assistant", "content": summary})
             st.rerun()
         except Exception as e:
             st.error(f"Error: {e}")
-        finally:
-            db.close()
     
     if st.button("Security Status"):
-        db = DatabaseManager("database/platform.db")
-        db.connect()
         try:
-            critical = db.fetch_one("SELECT COUNT(*) FROM security_incidents WHERE severity = 'critical' AND status != 'Resolved'")[0]
-            high = db.fetch_one("SELECT COUNT(*) FROM security_incidents WHERE severity = 'high' AND status != 'Resolved'")[0]
+            platform_stats = stats_service.get_stats()
+            critical = platform_stats.active_count("security_incidents", "severity", "critical", "Resolved")
+            high = platform_stats.active_count("security_incidents", "severity", "high", "Resolved")
             
             status = f"**Security Status:**\n\nCritical: {critical} active\nHigh: {high} active\n\n"
             status += "Immediate attention required!" if critical > 0 else "No critical incidents."
@@ -58,15 +66,12 @@ with st.sidebar:
             st.rerun()
         except Exception as e:
             st.error(f"Error: {e}")
-        finally:
-            db.close()
     
     if st.button("IT Ticket Stats"):
-        db = DatabaseManager("database/platform.db")
-        db.connect()
         try:
-            open_tickets = db.fetch_one("SELECT COUNT(*) FROM it_tickets WHERE status = 'Open'")[0]
-            in_progress = db.fetch_one("SELECT COUNT(*) FROM it_tickets WHERE status = 'In Progress'")[0]
+            platform_stats = stats_service.get_stats()
+            open_tickets = platform_stats.count("it_tickets", "status", "Open")
+            in_progress = platform_stats.count("it_tickets", "status", "In Progress")
             
             stats = f"**IT Ticket Stats:**\n\nOpen: {open_tickets}\nIn Progress: {in_progress}\n\n"
             stats += "High volume of open tickets!" if open_tickets > 5 else "Ticket queue is manageable."
@@ -75,19 +80,19 @@ with st.sidebar:
             st.rerun()
         except Exception as e:
             st.error(f"Error: {e}")
-        finally:
-            db.close()
     
     if st.button("Analyze Latest Incidents"):
-        db = DatabaseManager("database/platform.db")
+        db = DatabaseManager("database/platform.db", pooled=True, cached=True)
         db.connect()
         try:
-            rows = db.fetch_all("SELECT id, incident_type, severity, status, description FROM security_incidents ORDER BY id DESC LIMIT 3")
+            incidents = IncidentRepository(db)
+            recent = incidents.find(incidents.query().order_by("id", descending=True).limit(3))
             
-            if rows:
+            if recent:
                 prompt = "Analyze these recent security incidents:\n\n"
-                for row in rows:
-                    prompt += f"- **{row[1]}** (Severity: {row[2]})\n  Status: {row[3]}\n  Description: {row[4]}\n\n"
+                for incident in recent:
+                    prompt += (f"- **{incident.get_incident_type()}** (Severity: {incident.get_severity()})\n"
+                               f"  Status: {incident.get_status()}\n  Description: {incident.get_description()}\n\n")
                 prompt += "Provide a summary and risk assessment."
                 
                 response = ai.send_message(prompt)
@@ -102,7 +107,7 @@ with st.sidebar:
             db.close()
     
     if st.button("Dataset Recommendations"):
-        db = DatabaseManager("database/platform.db")
+        db = DatabaseManager("database/platform.db", pooled=True, cached=True)
         db.connect()
         try:
             rows = db.fetch_all("SELECT id, name, size_bytes, rows, source FROM datasets ORDER BY id DESC LIMIT 5")
@@ -126,15 +131,17 @@ with st.sidebar:
             db.close()
     
     if st.button("Prioritize Tickets"):
-        db = DatabaseManager("database/platform.db")
+        db = DatabaseManager("database/platform.db", pooled=True, cached=True)
         db.connect()
         try:
-            rows = db.fetch_all("SELECT id, title, priority, status, assigned_to FROM it_tickets WHERE status != 'Closed' ORDER BY id DESC")
+            # Stream rows most urgent first (priority_rank index) so the backlog is never held as a list
+            prompt = "Help prioritize these IT support tickets:\n\n"
+            ticket_count = 0
+            for row in db.fetch_iter("SELECT id, title, priority, status, assigned_to FROM it_tickets WHERE status != 'Closed' ORDER BY priority_rank DESC, id"):
+                prompt += f"- Ticket #{row[0]}: {row[1]}\n  Priority: {row[2]} | Status: {row[3]} | Assigned: {row[4]}\n\n"
+                ticket_count += 1
             
-            if rows:
-                prompt = "Help prioritize these IT support tickets:\n\n"
-                for row in rows:
-                    prompt += f"- Ticket #{row[0]}: {row[1]}\n  Priority: {row[2]} | Status: {row[3]} | Assigned: {row[4]}\n\n"
+            if ticket_count > 0:
                 prompt += "Recommend: 1) Which tickets need immediate attention 2) Workload distribution"
                 
                 response = ai.send_message(prompt)
@@ -0,0 +1,75 @@
+import streamlit as st
+import pandas as pd
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.database_manager import DatabaseManager
+from services.db_snapshot import get_snapshot
+
+st.set_page_config(page_title="Diagnostics", page_icon="🩺", layout="wide")
+st.title("Database Diagnostics")
+st.markdown("---")
+
+# Admin-only page
+if st.session_state.get("current_user") is None:
+    st.error("Please log in first!")
+    st.stop()
+if st.session_state.get("current_role") != "admin":
+    st.error("Diagnostics are only available to admin users.")
+    st.stop()
+
+db = DatabaseManager("database/platform.db", pooled=True, snapshot=True)
+stats = db.query_stats()
+
+tab1, tab2, tab3 = st.tabs(["Query Timings", "Slow Queries", "Connections & Cache"])
+
+with tab1:
+    st.subheader("Statements by Total Time")
+    summary = stats.summary()
+    if len(summary) > 0:
+        df = pd.DataFrame(summary, columns=["sql", "calls", "rows", "total_ms", "avg_ms", "max_ms"])
+        st.dataframe(df.round(3), use_container_width=True, hide_index=True)
+    else:
+        st.info("No queries recorded yet.")
+
+    col1, col2 = st.columns(2)
+    col1.download_button("Export Statistics as JSON", stats.to_json(), file_name="query_stats.json", mime="application/json")
+    if col2.button("Reset Statistics"):
+        stats.reset()
+        st.rerun()
+
+with tab2:
+    st.subheader("Slow-Query Log")
+    threshold = st.number_input("Slow threshold (ms)", min_value=0.0, value=float(stats.get_slow_threshold()), step=10.0)
+    if threshold != stats.get_slow_threshold():
+        stats.set_slow_threshold(threshold)
+
+    slow = stats.slow_queries()
+    if len(slow) > 0:
+        for entry in slow:
+            with st.container(border=True):
+                st.write(f"**{entry['elapsed_ms']:.1f} ms** · {entry['rows']} row(s) · {entry['at']}")
+                st.code(entry["sql"], language="sql")
+                if entry["plan"]:
+                    st.write("**Query plan:**")
+                    st.code("\n".join(entry["plan"]))
+    else:
+        st.info("No statements above the threshold.")
+
+with tab3:
+    col_left, col_right = st.columns(2)
+    with col_left:
+        st.subheader("Performance Profile")
+        st.json(db.profile_info())
+        st.subheader("Connection Pool")
+        st.json(db.pool_stats())
+    with col_right:
+        st.subheader("Result Cache")
+        st.json(db.cache_stats())
+        st.subheader("Read Snapshot")
+        snapshot_stats = db.snapshot_stats()
+        interval = st.number_input("Snapshot refresh interval (s)", min_value=1.0,
+                                   value=float(snapshot_stats["refresh_interval_s"]), step=5.0)
+        if interval != snapshot_stats["refresh_interval_s"]:
+            get_snapshot("database/platform.db").set_refresh_interval(interval)
+        st.json(snapshot_stats)
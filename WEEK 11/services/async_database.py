@@ -0,0 +1,90 @@
+import asyncio
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable
+
+from services.database_manager import DatabaseManager
+
+
+class AsyncDatabaseManager:
+    """Asyncio facade over DatabaseManager.
+
+    Each call runs on a dedicated thread pool with its own pooled connection,
+    so independent queries can be awaited together with asyncio.gather().
+    """
+
+    def __init__(self, db_path: str, max_workers: int = 4, cached: bool = False, profile: str | None = None):
+        self._db_path = db_path
+        self._cached = cached
+        self._profile = profile
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db")
+
+    def _manager(self) -> DatabaseManager:
+        """Build a DatabaseManager for one call on a worker thread."""
+        return DatabaseManager(self._db_path, pooled=True, cached=self._cached, profile=self._profile)
+
+    async def run(self, func: Callable[[DatabaseManager], Any]) -> Any:
+        """Run func(db) on the executor, e.g. a whole transaction() block."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: func(self._manager()))
+
+    async def execute_query(self, sql: str, params: Iterable[Any] = ()):
+        """Execute a write query (INSERT, UPDATE, DELETE)."""
+        params = tuple(params)
+        return await self.run(lambda db: db.execute_query(sql, params))
+
+    async def execute_many(self, sql: str, seq_of_params: Iterable[Iterable[Any]]) -> int:
+        """Execute a write query once per parameter tuple with a single commit."""
+        return await self.run(lambda db: db.execute_many(sql, seq_of_params))
+
+    async def fetch_one(self, sql: str, params: Iterable[Any] = ()):
+        """Execute a SELECT query and return one row."""
+        params = tuple(params)
+        return await self.run(lambda db: db.fetch_one(sql, params))
+
+    async def fetch_all(self, sql: str, params: Iterable[Any] = ()):
+        """Execute a SELECT query and return all rows."""
+        params = tuple(params)
+        return await self.run(lambda db: db.fetch_all(sql, params))
+
+    async def fetch_scalars(self, *queries: str) -> list:
+        """Run several single-value SELECTs concurrently and return their first columns."""
+        rows = await asyncio.gather(*(self.fetch_one(sql) for sql in queries))
+        return [row[0] if row is not None else None for row in rows]
+
+    def shutdown(self) -> None:
+        """Stop the executor once queued calls finish."""
+        self._executor.shutdown(wait=True)
+
+
+_managers: dict[tuple[str, bool], AsyncDatabaseManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_async_db(db_path: str, cached: bool = False) -> AsyncDatabaseManager:
+    """Return the process-wide async manager for a database file."""
+    key = (os.path.abspath(db_path), cached)
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = AsyncDatabaseManager(db_path, cached=cached)
+            _managers[key] = manager
+        return manager
+
+
+async def print_table_counts(db_path: str) -> None:
+    """Print the row count of every platform table, counting them concurrently."""
+    adb = AsyncDatabaseManager(db_path)
+    tables = ["users", "security_incidents", "datasets", "it_tickets"]
+    counts = await adb.fetch_scalars(*(f"SELECT COUNT(*) FROM {table}" for table in tables))
+    for table, count in zip(tables, counts):
+        print(f"{table:<20} {count:>10,}")
+    adb.shutdown()
+
+
+if __name__ == "__main__":
+    # python -m services.async_database [path/to/platform.db]
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join("database", "platform.db")
+    asyncio.run(print_table_counts(path))
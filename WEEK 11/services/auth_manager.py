@@ -1,6 +1,7 @@
 from typing import Optional
 from models.user import User
 from services.database_manager import DatabaseManager
+from services.repositories import UserRepository
 import hashlib  # simple example; replace with bcrypt in real project
 
 
@@ -37,14 +38,7 @@ class AuthManager:
     
     def login_user(self, username: str, password: str) -> Optional[User]:
         """Authenticate user and return User object if successful, None otherwise."""
-        row = self._db.fetch_one(
-            "SELECT username, password_hash, role FROM users WHERE username = ?",
-            (username,),
-        )
-        if row is None:
-            return None
-        
-        username_db, password_hash_db, role_db = row
-        if SimpleHasher.check_password(password, password_hash_db):
-            return User(username_db, password_hash_db, role_db)
+        user = UserRepository(self._db).get(username)
+        if user is not None and user.verify_password(password, SimpleHasher):
+            return user
         return None
@@ -0,0 +1,114 @@
+
+from services.database_manager import DatabaseManager
+from services.query_builder import check_identifier
+
+# Tables with row-version tracking: table -> columns whose edits count as a change
+TRACKED_TABLES: dict[str, tuple[str, ...]] = {
+    "security_incidents": ("incident_type", "severity", "status", "description"),
+    "it_tickets": ("title", "priority", "status", "assigned_to"),
+}
+
+# One global counter, so versions from every table and tombstone are comparable
+CHANGE_TABLES_SQL = [
+    """
+    CREATE TABLE IF NOT EXISTS change_sequence (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL
+    )
+    """,
+    "INSERT OR IGNORE INTO change_sequence (id, version) VALUES (1, 1)",
+    """
+    CREATE TABLE IF NOT EXISTS change_tombstones (
+        version INTEGER PRIMARY KEY,
+        domain TEXT NOT NULL,
+        row_id INTEGER NOT NULL,
+        deleted_at TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_tombstones_domain_version ON change_tombstones (domain, version)",
+]
+
+_NOW = "strftime('%Y-%m-%dT%H:%M:%fZ', 'now')"
+_BUMP = "UPDATE change_sequence SET version = version + 1 WHERE id = 1;"
+_CURRENT = "(SELECT version FROM change_sequence WHERE id = 1)"
+
+
+def change_tracking_sql() -> list[str]:
+    """Statements adding updated_at/row_version to each tracked table, backfilling
+    existing rows as version 1, and the triggers that stamp later writes.
+    """
+    statements = list(CHANGE_TABLES_SQL)
+    for table in TRACKED_TABLES:
+        stamp = f"UPDATE {table} SET row_version = {_CURRENT}, updated_at = {_NOW} WHERE id = NEW.id;"
+        tombstone = (
+            f"INSERT INTO change_tombstones (version, domain, row_id, deleted_at) "
+            f"VALUES ({_CURRENT}, '{table}', OLD.id, {_NOW});"
+        )
+        statements += [
+            f"ALTER TABLE {table} ADD COLUMN updated_at TEXT",
+            f"ALTER TABLE {table} ADD COLUMN row_version INTEGER NOT NULL DEFAULT 0",
+            f"UPDATE {table} SET row_version = 1, updated_at = {_NOW}",
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_row_version ON {table} (row_version)",
+            f"CREATE TRIGGER IF NOT EXISTS trg_{table}_version_insert AFTER INSERT ON {table} BEGIN\n{_BUMP}\n{stamp}\nEND",
+            # The WHEN clause skips the trigger's own stamping UPDATE
+            f"CREATE TRIGGER IF NOT EXISTS trg_{table}_version_update AFTER UPDATE ON {table} "
+            f"WHEN NEW.row_version = OLD.row_version BEGIN\n{_BUMP}\n{stamp}\nEND",
+            f"CREATE TRIGGER IF NOT EXISTS trg_{table}_version_delete AFTER DELETE ON {table} BEGIN\n{_BUMP}\n{tombstone}\nEND",
+        ]
+    return statements
+
+
+class ChangeSet:
+    """Rows changed and ids deleted since a cursor, plus the cursor to ask with next."""
+
+    def __init__(self, changed: list, deleted_ids: list[int], cursor: int):
+        self._changed = changed
+        self._deleted_ids = deleted_ids
+        self._cursor = cursor
+
+    def get_changed(self) -> list:
+        """Get rows inserted or updated since the cursor (latest state only)."""
+        return self._changed
+
+    def get_deleted_ids(self) -> list[int]:
+        """Get ids of rows deleted since the cursor."""
+        return self._deleted_ids
+
+    def get_cursor(self) -> int:
+        """Get the cursor to pass to the next fetch_changes() call."""
+        return self._cursor
+
+    def is_empty(self) -> bool:
+        """Check whether nothing changed."""
+        return not self._changed and not self._deleted_ids
+
+
+def fetch_changes(db: DatabaseManager, table: str, columns: list[str], cursor: int = 0) -> ChangeSet:
+    """Return rows of `table` changed after `cursor` and the ids deleted since.
+    `columns` must start with "id"; cursor 0 returns every row. Rows and
+    tombstones come from one UNION ALL statement, so both see the same state.
+    """
+    if table not in TRACKED_TABLES:
+        raise ValueError(f"Table is not change-tracked: {table!r}")
+    if not columns or columns[0] != "id":
+        raise ValueError("The first column must be id")
+    selected = ", ".join(check_identifier(column) for column in columns)
+    padding = "".join(", NULL" for _ in columns[1:])
+    rows = db.fetch_all(
+        f"SELECT row_version, 0, {selected} FROM {table} WHERE row_version > ? "
+        f"UNION ALL SELECT version, 1, row_id{padding} FROM change_tombstones "
+        f"WHERE domain = ? AND version > ? ORDER BY 1",
+        (cursor, table, cursor),
+    )
+    # Replay in version order so a delete followed by a re-insert ends up as a change
+    changed: dict[int, tuple] = {}
+    deleted: set[int] = set()
+    for version, is_tombstone, *values in rows:
+        cursor = max(cursor, version)
+        if is_tombstone:
+            changed.pop(values[0], None)
+            deleted.add(values[0])
+        else:
+            changed[values[0]] = tuple(values)
+            deleted.discard(values[0])
+    return ChangeSet(list(changed.values()), sorted(deleted), cursor)
@@ -0,0 +1,147 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterator
+
+from services.db_profiles import apply_profile
+
+
+class ConnectionPool:
+    """Fixed-size pool of SQLite connections shared across sessions.
+
+    A thread checks out one connection and keeps it until its outermost
+    checkout ends, so nested calls on the same thread reuse it.
+    """
+
+    def __init__(self, db_path: str, size: int = 5, max_idle: float = 300.0, timeout: float = 10.0,
+                 profile: str = "default"):
+        self._db_path = db_path
+        self._profile = profile
+        self._size = size
+        self._max_idle = max_idle
+        self._timeout = timeout
+        self._idle: deque[tuple[sqlite3.Connection, float]] = deque()
+        self._created = 0
+        self._cond = threading.Condition()
+        self._local = threading.local()
+        self._stats = {"hits": 0, "misses": 0, "waits": 0, "discarded": 0}
+
+    def _new_connection(self) -> sqlite3.Connection:
+        """Open a connection that may be handed between threads."""
+        conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        apply_profile(conn, self._profile)
+        return conn
+
+    @staticmethod
+    def _is_healthy(conn: sqlite3.Connection) -> bool:
+        """Check that an idle connection is still usable."""
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        """Close a connection and free its slot. Caller holds the lock."""
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        self._created -= 1
+        self._stats["discarded"] += 1
+
+    def acquire(self) -> sqlite3.Connection:
+        """Check out a connection for the current thread."""
+        held = getattr(self._local, "held", None)
+        if held is not None:
+            held[1] += 1
+            return held[0]
+
+        deadline = time.monotonic() + self._timeout
+        conn = None
+        with self._cond:
+            while conn is None:
+                if self._idle:
+                    candidate, last_used = self._idle.pop()
+                    if time.monotonic() - last_used > self._max_idle or not self._is_healthy(candidate):
+                        self._discard(candidate)
+                        continue
+                    self._stats["hits"] += 1
+                    conn = candidate
+                elif self._created < self._size:
+                    self._created += 1
+                    self._stats["misses"] += 1
+                    try:
+                        conn = self._new_connection()
+                    except sqlite3.Error:
+                        self._created -= 1
+                        raise
+                else:
+                    remaining = deadline - time.monotonic()
+                    self._stats["waits"] += 1
+                    if remaining <= 0 or not self._cond.wait(remaining):
+                        raise TimeoutError(f"No pooled connection available for {self._db_path}")
+
+        self._local.held = [conn, 1]
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection checked out by the current thread."""
+        held = getattr(self._local, "held", None)
+        if held is None or held[0] is not conn:
+            raise ValueError("Connection was not checked out by this thread")
+        held[1] -= 1
+        if held[1] > 0:
+            return
+        self._local.held = None
+
+        if conn.in_transaction:
+            conn.rollback()
+        with self._cond:
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Context manager wrapping acquire() and release()."""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def stats(self) -> dict:
+        """Return pool counters and current occupancy."""
+        with self._cond:
+            return {
+                **self._stats,
+                "size": self._size,
+                "open": self._created,
+                "idle": len(self._idle),
+                "in_use": self._created - len(self._idle),
+            }
+
+    def close_all(self) -> None:
+        """Close every idle connection in the pool."""
+        with self._cond:
+            while self._idle:
+                conn, _ = self._idle.pop()
+                self._discard(conn)
+
+
+_pools: dict[tuple[str, str], ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: str, profile: str = "default", **kwargs) -> ConnectionPool:
+    """Return the process-wide pool for a database file and profile, creating it on first use."""
+    key = (os.path.abspath(db_path), profile)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(db_path, profile=profile, **kwargs)
+            _pools[key] = pool
+        return pool
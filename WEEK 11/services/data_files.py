@@ -0,0 +1,117 @@
+import os
+import threading
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet sidecars are optional
+    pa = pq = None
+
+# Low-cardinality text columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = ("severity", "status", "priority", "incident_type", "source", "category")
+
+SIDECAR_SUFFIX = ".parquet"
+_SIGNATURE_KEY = b"platform_source_signature"
+
+
+def _signature(path: str) -> str:
+    """Identify a file version by modification time and size."""
+    info = os.stat(path)
+    return f"{info.st_mtime_ns}:{info.st_size}"
+
+
+def _parse_csv(path: str) -> pd.DataFrame:
+    """Parse a CSV with categorical dtypes for the known low-cardinality columns."""
+    header = pd.read_csv(path, nrows=0).columns
+    dtypes = {column: "category" for column in CATEGORICAL_COLUMNS if column in header}
+    return pd.read_csv(path, dtype=dtypes)
+
+
+def _read_sidecar(path: str, signature: str) -> pd.DataFrame | None:
+    """Load the Parquet sidecar if it was written from this exact CSV version."""
+    sidecar = path + SIDECAR_SUFFIX
+    if pq is None or not os.path.exists(sidecar):
+        return None
+    try:
+        metadata = pq.read_schema(sidecar).metadata or {}
+        if metadata.get(_SIGNATURE_KEY) != signature.encode():
+            return None
+        return pq.read_table(sidecar).to_pandas()
+    except (OSError, pa.ArrowException):
+        return None
+
+
+def _write_sidecar(path: str, signature: str, frame: pd.DataFrame) -> None:
+    """Save a Parquet copy tagged with the CSV version it came from. Best effort."""
+    if pa is None:
+        return
+    try:
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), _SIGNATURE_KEY: signature.encode()})
+        pq.write_table(table, path + SIDECAR_SUFFIX)
+    except (OSError, pa.ArrowException):
+        pass
+
+
+class DataFileCache:
+    """Process-wide cache of parsed CSV data files.
+
+    Each file is parsed once and re-parsed only when its mtime or size changes.
+    With pyarrow installed a Parquet sidecar next to the CSV lets a fresh
+    process skip CSV parsing. Returned frames are shared: treat them as read-only.
+    """
+
+    def __init__(self):
+        self._entries: dict[str, tuple[str, pd.DataFrame]] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "parses": 0, "sidecar_loads": 0}
+
+    def get(self, path: str) -> pd.DataFrame:
+        """Return the parsed contents of a CSV file, or an empty frame if it is missing."""
+        key = os.path.abspath(path)
+        if not os.path.exists(key):
+            return pd.DataFrame()
+        signature = _signature(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._stats["hits"] += 1
+                return entry[1]
+            frame = _read_sidecar(key, signature)
+            if frame is not None:
+                self._stats["sidecar_loads"] += 1
+            else:
+                frame = _parse_csv(key)
+                self._stats["parses"] += 1
+                _write_sidecar(key, signature, frame)
+            self._entries[key] = (signature, frame)
+            return frame
+
+    def invalidate(self, path: str | None = None) -> None:
+        """Drop one file, or every file, from memory."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(path), None)
+
+    def stats(self) -> dict:
+        """Return hit/parse counters and the files held in memory."""
+        with self._lock:
+            memory = sum(int(frame.memory_usage(deep=True).sum()) for _, frame in self._entries.values())
+            return {**self._stats, "files": len(self._entries), "memory_bytes": memory}
+
+
+_cache = DataFileCache()
+
+
+def get_data_file_cache() -> DataFileCache:
+    """Return the process-wide data file cache."""
+    return _cache
+
+
+def read_data_file(path: str) -> pd.DataFrame:
+    """Read a CSV data file through the process-wide cache."""
+    return _cache.get(path)
@@ -1,46 +1,299 @@
+import csv
 import sqlite3
-from typing import Any, Iterable
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, TextIO
+
+from services.connection_pool import ConnectionPool, get_pool
+from services.db_profiles import apply_profile, read_settings, resolve_profile
+from services.db_snapshot import DatabaseSnapshot, get_snapshot, mark_snapshot_dirty
+from services.pagination import Page, build_page
+from services.query_builder import Query, check_identifier
+from services.query_cache import MISS, QueryCache, get_cache, table_written, tables_read, trigger_targets
+from services.query_stats import QueryStats, get_query_stats
+from services.search_index import SEARCH_INDEXES, match_expression
 
 
 class DatabaseManager:
     """Handles SQLite database connections and queries."""
-    
-    def __init__(self, db_path: str):
+
+    DEFAULT_ARRAYSIZE = 1000
+
+    def __init__(self, db_path: str, pooled: bool = False, profile: str | None = None,
+                 cached: bool = False, snapshot: bool = False):
         self._db_path = db_path
+        self._profile = resolve_profile(profile)
         self._connection: sqlite3.Connection | None = None
-    
+        self._pool: ConnectionPool | None = get_pool(db_path, profile=self._profile) if pooled else None
+        # Writes always invalidate the shared cache; `cached` only controls reads
+        self._cache: QueryCache = get_cache(db_path)
+        self._cached = cached
+        self._stats: QueryStats = get_query_stats(db_path)
+        # Reads from an in-memory copy; writes still go to the file
+        self._snapshot: DatabaseSnapshot | None = get_snapshot(db_path) if snapshot else None
+        self._tx_depth = 0
+        self._written: set[str] = set()
+        self._written_unknown = False
+
     def connect(self) -> None:
-        """Establish connection to the SQLite database."""
-        if self._connection is None:
+        """Establish connection to the SQLite database.
+        In pooled mode connections are checked out per call instead.
+        """
+        if self._pool is None and self._connection is None:
             self._connection = sqlite3.connect(self._db_path)
-    
+            apply_profile(self._connection, self._profile)
+
     def close(self) -> None:
         """Close the database connection."""
         if self._connection is not None:
             self._connection.close()
             self._connection = None
-    
+
+    @contextmanager
+    def _checkout(self) -> Iterator[sqlite3.Connection]:
+        """Yield the connection to run a statement on."""
+        if self._pool is not None:
+            with self._pool.connection() as conn:
+                yield conn
+        else:
+            if self._connection is None:
+                self.connect()
+            yield self._connection
+
+    @contextmanager
+    def _read_checkout(self) -> Iterator[sqlite3.Connection]:
+        """Yield the connection to run a SELECT on, preferring the snapshot.
+        Reads inside a transaction use the file so they see their own writes.
+        """
+        if self._snapshot is not None and self._tx_depth == 0:
+            with self._snapshot.connection() as conn:
+                if conn is not None:
+                    yield conn
+                    return
+        with self._checkout() as conn:
+            yield conn
+
+    def snapshot_stats(self) -> dict | None:
+        """Return snapshot refresh counters and staleness, or None when not in snapshot mode."""
+        return self._snapshot.stats() if self._snapshot is not None else None
+
+    def pool_stats(self) -> dict | None:
+        """Return pool hit/miss/wait counters, or None when not pooled."""
+        return self._pool.stats() if self._pool is not None else None
+
+    def cache_stats(self) -> dict | None:
+        """Return counters for the shared result cache."""
+        return self._cache.stats()
+
+    def query_stats(self) -> QueryStats:
+        """Return the shared timing and slow-query statistics for this database."""
+        return self._stats
+
+    def profile_info(self) -> dict:
+        """Return the selected profile name and the PRAGMA values in effect."""
+        with self._checkout() as conn:
+            return {"profile": self._profile, "settings": read_settings(conn)}
+
+    @contextmanager
+    def transaction(self) -> Iterator["DatabaseManager"]:
+        """Group writes into a single commit, rolling back on error.
+        Nested transactions join the outermost one.
+        """
+        with self._checkout() as conn:
+            if self._tx_depth == 0 and not conn.in_transaction:
+                # Explicit BEGIN so schema changes are covered too
+                conn.execute("BEGIN")
+            self._tx_depth += 1
+            try:
+                yield self
+            except BaseException:
+                if self._tx_depth == 1:
+                    conn.rollback()
+                raise
+            else:
+                if self._tx_depth == 1:
+                    conn.commit()
+            finally:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self._flush_invalidations()
+
+    def _commit_unless_in_transaction(self, conn: sqlite3.Connection) -> None:
+        """Commit now unless an enclosing transaction() will."""
+        if self._tx_depth == 0:
+            conn.commit()
+
+    def _record_write(self, sql: str) -> None:
+        """Note the table a write touched and invalidate cached reads of it
+        once the write is committed.
+        """
+        table = table_written(sql)
+        if table is None:
+            self._written_unknown = True
+        else:
+            self._written.add(table)
+        if self._tx_depth == 0:
+            self._flush_invalidations()
+
+    def _flush_invalidations(self) -> None:
+        """Invalidate cache entries for every table written since the last flush."""
+        if self._written and not self._written_unknown and self._cache.needs_dependents():
+            self._load_trigger_dependents()
+        if self._written_unknown or self._written:
+            self._cache.invalidate(None if self._written_unknown else self._written)
+            mark_snapshot_dirty(self._db_path)
+        self._written = set()
+        self._written_unknown = False
+
+    def _load_trigger_dependents(self) -> None:
+        """Tell the cache which tables each table's triggers also write."""
+        dependents: dict[str, set[str]] = {}
+        with self._checkout() as conn:
+            rows = conn.execute("SELECT tbl_name, sql FROM sqlite_master WHERE type = 'trigger'").fetchall()
+        for table, sql in rows:
+            dependents.setdefault(table.lower(), set()).update(trigger_targets(sql or ""))
+        self._cache.set_dependents(dependents)
+
     def execute_query(self, sql: str, params: Iterable[Any] = ()):
         """Execute a write query (INSERT, UPDATE, DELETE)."""
-        if self._connection is None:
-            self.connect()
-        cur = self._connection.cursor()
-        cur.execute(sql, tuple(params))
-        self._connection.commit()
+        params = tuple(params)
+        with self._checkout() as conn:
+            start = time.perf_counter()
+            cur = conn.cursor()
+            cur.execute(sql, params)
+            self._commit_unless_in_transaction(conn)
+            self._stats.record(conn, sql, params, time.perf_counter() - start, cur.rowcount)
+        self._record_write(sql)
         return cur
-    
+
+    def execute_many(self, sql: str, seq_of_params: Iterable[Iterable[Any]]) -> int:
+        """Execute a write query once per parameter tuple with a single commit.
+        Returns the number of affected rows.
+        """
+        with self.transaction(), self._checkout() as conn:
+            start = time.perf_counter()
+            cur = conn.cursor()
+            cur.executemany(sql, (tuple(params) for params in seq_of_params))
+            self._stats.record(conn, sql, (), time.perf_counter() - start, cur.rowcount)
+            self._record_write(sql)
+            return cur.rowcount
+
+    def _cached_read(self, kind: str, sql: str, params: tuple, fetch: Callable[[sqlite3.Cursor], Any]):
+        """Serve a SELECT from the result cache, running it on a miss.
+        Reads inside a transaction bypass the cache so uncommitted rows are never shared.
+        """
+        tables = tables_read(sql)
+        use_cache = self._cached and self._tx_depth == 0 and tables
+        if use_cache:
+            key = (kind, sql, params)
+            result = self._cache.get(key)
+            if result is not MISS:
+                return result
+            versions = self._cache.versions(tables)
+        with self._read_checkout() as conn:
+            start = time.perf_counter()
+            cur = conn.cursor()
+            cur.execute(sql, params)
+            result = fetch(cur)
+            rows = len(result) if kind == "all" else int(result is not None)
+            self._stats.record(conn, sql, params, time.perf_counter() - start, rows)
+        if use_cache:
+            self._cache.put(key, tables, result, versions)
+        return result
+
     def fetch_one(self, sql: str, params: Iterable[Any] = ()):
         """Execute a SELECT query and return one row."""
-        if self._connection is None:
-            self.connect()
-        cur = self._connection.cursor()
-        cur.execute(sql, tuple(params))
-        return cur.fetchone()
-    
+        return self._cached_read("one", sql, tuple(params), sqlite3.Cursor.fetchone)
+
     def fetch_all(self, sql: str, params: Iterable[Any] = ()):
         """Execute a SELECT query and return all rows."""
-        if self._connection is None:
-            self.connect()
-        cur = self._connection.cursor()
-        cur.execute(sql, tuple(params))
-        return cur.fetchall()
\ No newline at end of file
+        return list(self._cached_read("all", sql, tuple(params), sqlite3.Cursor.fetchall))
+
+    def fetch_chunks(self, sql: str, params: Iterable[Any] = (), size: int | None = None) -> Iterator[list]:
+        """Execute a SELECT query and yield lists of up to `size` rows.
+        Streams from the cursor instead of materializing the whole result; the
+        connection stays checked out until the generator is exhausted or closed.
+        """
+        params = tuple(params)
+        with self._checkout() as conn:
+            # Time only the cursor work, not the consumer between yields
+            start = time.perf_counter()
+            cur = conn.cursor()
+            cur.arraysize = size or self.DEFAULT_ARRAYSIZE
+            cur.execute(sql, params)
+            elapsed = time.perf_counter() - start
+            count = 0
+            while True:
+                start = time.perf_counter()
+                rows = cur.fetchmany()
+                elapsed += time.perf_counter() - start
+                if not rows:
+                    break
+                count += len(rows)
+                yield rows
+            self._stats.record(conn, sql, params, elapsed, count)
+
+    def fetch_iter(self, sql: str, params: Iterable[Any] = (), arraysize: int | None = None) -> Iterator[tuple]:
+        """Execute a SELECT query and yield rows one at a time."""
+        for rows in self.fetch_chunks(sql, params, arraysize):
+            yield from rows
+
+    def write_csv(self, out: TextIO, sql: str, params: Iterable[Any] = (), arraysize: int | None = None) -> int:
+        """Stream a SELECT result as CSV (with a header row) into `out`.
+        Returns the number of data rows written.
+        """
+        params = tuple(params)
+        writer = csv.writer(out)
+        count = 0
+        with self._checkout() as conn:
+            start = time.perf_counter()
+            cur = conn.cursor()
+            cur.arraysize = arraysize or self.DEFAULT_ARRAYSIZE
+            cur.execute(sql, params)
+            writer.writerow([col[0] for col in cur.description])
+            while True:
+                rows = cur.fetchmany()
+                if not rows:
+                    break
+                writer.writerows(rows)
+                count += len(rows)
+            self._stats.record(conn, sql, params, time.perf_counter() - start, count)
+        return count
+
+    def _where_clause(self, where: dict[str, Any] | None) -> tuple[str, tuple]:
+        """Compile {column: value} equality filters into a WHERE clause and params."""
+        if not where:
+            return "", ()
+        conditions = " AND ".join(f"{check_identifier(column)} = ?" for column in where)
+        return f" WHERE {conditions}", tuple(where.values())
+
+    def count(self, table: str, where: dict[str, Any] | None = None) -> int:
+        """Return the number of rows matching the equality filters."""
+        where_sql, params = self._where_clause(where)
+        return self.fetch_one(f"SELECT COUNT(*) FROM {check_identifier(table)}{where_sql}", params)[0]
+
+    def fetch_page(self, query: Query, page_size: int, after: Any = None, before: Any = None,
+                   key_column: str = "id") -> Page:
+        """Fetch one page of a query ordered by key_column descending, seeking
+        past a key instead of using OFFSET. Pass the previous page's last key as
+        `after` for the next page, or its first key as `before` for the previous page.
+        """
+        key_index = query.get_columns().index(key_column)
+        if before is not None:
+            query = query.where(key_column, ">", before).order_by(key_column)
+        elif after is not None:
+            query = query.where(key_column, "<", after).order_by(key_column, descending=True)
+        else:
+            query = query.order_by(key_column, descending=True)
+        rows = self.fetch_all(*query.limit(page_size + 1).to_sql())
+        return build_page(rows, page_size, key=lambda row: row[key_index], after=after, before=before)
+
+    def search(self, query: Query, text: str) -> list:
+        """Full-text search the table's FTS5 index, keeping the query's filters and limit.
+        Returns the query's columns plus a highlighted snippet, best match first.
+        """
+        index, _ = SEARCH_INDEXES[query.get_table()]
+        expression = match_expression(text)
+        if expression is None:
+            return []
+        return self.fetch_all(*query.search_sql(index, expression))
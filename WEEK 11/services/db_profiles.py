@@ -0,0 +1,59 @@
+import os
+import sqlite3
+
+# Named SQLite tuning profiles applied when a connection is opened.
+# Pick one per deployment with the PLATFORM_DB_PROFILE environment variable.
+PROFILES: dict[str, dict[str, str | int]] = {
+    # Stock SQLite settings (rollback journal, default cache, no mmap)
+    "default": {},
+    # WAL so dashboards keep reading while forms write
+    "balanced": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -20000,  # negative = KiB, so ~20 MB
+        "mmap_size": 268435456,  # 256 MB
+        "temp_store": "MEMORY",
+    },
+    # Dashboard-heavy deployments with plenty of RAM
+    "read_heavy": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65536,  # ~64 MB
+        "mmap_size": 1073741824,  # 1 GB
+        "temp_store": "MEMORY",
+    },
+    # Every commit is fsynced; slower writes, safest on power loss
+    "durable": {
+        "busy_timeout": 10000,
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -8000,
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+    },
+}
+
+DEFAULT_PROFILE = "balanced"
+PROFILE_ENV_VAR = "PLATFORM_DB_PROFILE"
+REPORTED_PRAGMAS = ("journal_mode", "synchronous", "cache_size", "mmap_size", "temp_store", "busy_timeout")
+
+
+def resolve_profile(name: str | None = None) -> str:
+    """Return the profile to use: the given name, else the env var, else the default."""
+    resolved = name or os.environ.get(PROFILE_ENV_VAR) or DEFAULT_PROFILE
+    if resolved not in PROFILES:
+        raise ValueError(f"Unknown database profile '{resolved}'. Choose from: {', '.join(PROFILES)}")
+    return resolved
+
+
+def apply_profile(conn: sqlite3.Connection, name: str) -> None:
+    """Apply a profile's PRAGMA settings to a freshly opened connection."""
+    for pragma, value in PROFILES[name].items():
+        conn.execute(f"PRAGMA {pragma} = {value}").fetchall()
+
+
+def read_settings(conn: sqlite3.Connection) -> dict:
+    """Read back the PRAGMA values actually in effect on a connection."""
+    return {pragma: conn.execute(f"PRAGMA {pragma}").fetchone()[0] for pragma in REPORTED_PRAGMAS}
@@ -0,0 +1,142 @@
+import itertools
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+SNAPSHOT_REFRESH_ENV_VAR = "PLATFORM_SNAPSHOT_REFRESH_S"
+SNAPSHOT_MIN_REFRESH_ENV_VAR = "PLATFORM_SNAPSHOT_MIN_REFRESH_S"
+
+_snapshot_ids = itertools.count(1)
+
+
+class DatabaseSnapshot:
+    """Periodically refreshed in-memory copy of a database file for read-only dashboards.
+
+    The copy is rebuilt with the sqlite3 backup API when it is older than the
+    refresh interval or a write to the file has marked it dirty. It lives in a
+    named shared-cache memory database, so every reader opens its own connection
+    and reads run concurrently; the lock is only held while a new copy is swapped in.
+    """
+
+    def __init__(self, db_path: str, refresh_interval: float | None = None,
+                 min_refresh_interval: float | None = None):
+        if refresh_interval is None:
+            refresh_interval = float(os.environ.get(SNAPSHOT_REFRESH_ENV_VAR, 30))
+        if min_refresh_interval is None:
+            min_refresh_interval = float(os.environ.get(SNAPSHOT_MIN_REFRESH_ENV_VAR, 1))
+        self._db_path = db_path
+        self._refresh_interval = refresh_interval
+        self._min_refresh_interval = min_refresh_interval
+        self._id = next(_snapshot_ids)
+        self._generation = 0
+        self._uri: str | None = None
+        self._keeper: sqlite3.Connection | None = None  # keeps the current copy alive
+        self._refreshed_at = 0.0
+        self._dirty = True
+        self._lock = threading.Lock()  # guards swapping in a new copy
+        self._refresh_lock = threading.Lock()  # one rebuild at a time
+        self._stats = {"refreshes": 0, "reads": 0, "file_reads": 0, "last_refresh_ms": 0.0}
+
+    def get_refresh_interval(self) -> float:
+        """Get the refresh interval in seconds."""
+        return self._refresh_interval
+
+    def set_refresh_interval(self, seconds: float) -> None:
+        """Set the refresh interval in seconds."""
+        self._refresh_interval = seconds
+
+    def mark_dirty(self) -> None:
+        """Flag the copy as out of date after a write to the file."""
+        self._dirty = True
+
+    def _age(self) -> float:
+        return time.monotonic() - self._refreshed_at
+
+    def _needs_refresh(self) -> bool:
+        """Check whether the copy is missing, dirty or older than the interval."""
+        return self._uri is None or self._dirty or self._age() > self._refresh_interval
+
+    def _rebuild(self) -> None:
+        """Copy the file into a new shared-cache memory database and swap it in. Caller holds _refresh_lock."""
+        start = time.perf_counter()
+        self._dirty = False
+        self._generation += 1
+        uri = f"file:platform_snapshot_{os.getpid()}_{self._id}_{self._generation}?mode=memory&cache=shared"
+        keeper = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        source = sqlite3.connect(self._db_path)
+        try:
+            source.backup(keeper)
+        finally:
+            source.close()
+        with self._lock:
+            old, self._keeper, self._uri = self._keeper, keeper, uri
+            self._refreshed_at = time.monotonic()
+        # Readers still on the old copy keep it alive until they close
+        if old is not None:
+            old.close()
+        self._stats["refreshes"] += 1
+        self._stats["last_refresh_ms"] = (time.perf_counter() - start) * 1000
+
+    def refresh(self) -> None:
+        """Rebuild the in-memory copy now."""
+        with self._refresh_lock:
+            self._rebuild()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection | None]:
+        """Yield a private connection to the current copy, refreshing it first if stale.
+        Yields None while a write is newer than the copy but the copy was rebuilt less
+        than the minimum interval ago; the caller then reads the file, so a burst of
+        writes costs at most one backup per interval.
+        """
+        if self._needs_refresh():
+            if self._uri is not None and self._dirty and self._age() < self._min_refresh_interval:
+                self._stats["file_reads"] += 1
+                yield None
+                return
+            with self._refresh_lock:
+                # Another thread may have refreshed while we waited
+                if self._needs_refresh():
+                    self._rebuild()
+        conn = sqlite3.connect(self._uri, uri=True)
+        try:
+            self._stats["reads"] += 1
+            yield conn
+        finally:
+            conn.close()
+
+    def stats(self) -> dict:
+        """Return refresh counters and how stale the copy currently is."""
+        staleness = self._age() if self._uri is not None else None
+        return {
+            **self._stats,
+            "refresh_interval_s": self._refresh_interval,
+            "min_refresh_interval_s": self._min_refresh_interval,
+            "staleness_s": round(staleness, 3) if staleness is not None else None,
+            "dirty": self._dirty,
+        }
+
+
+_snapshots: dict[str, DatabaseSnapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def get_snapshot(db_path: str) -> DatabaseSnapshot:
+    """Return the process-wide snapshot for a database file, creating it on first use."""
+    key = os.path.abspath(db_path)
+    with _snapshots_lock:
+        snapshot = _snapshots.get(key)
+        if snapshot is None:
+            snapshot = DatabaseSnapshot(db_path)
+            _snapshots[key] = snapshot
+        return snapshot
+
+
+def mark_snapshot_dirty(db_path: str) -> None:
+    """Mark the snapshot of a database file dirty, if one exists."""
+    snapshot = _snapshots.get(os.path.abspath(db_path))
+    if snapshot is not None:
+        snapshot.mark_dirty()
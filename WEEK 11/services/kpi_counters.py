@@ -0,0 +1,127 @@
+from services.database_manager import DatabaseManager
+
+# Dimensions kept in kpi_counters per table. Each maps a dimension name to a
+# SQL expression over the row; "{row}" becomes NEW., OLD. or nothing.
+COUNTER_DIMENSIONS: dict[str, dict[str, str]] = {
+    "security_incidents": {
+        "total": "''",
+        "severity": "{row}severity",
+        "status": "{row}status",
+        "incident_type": "{row}incident_type",
+        "severity|status": "{row}severity || '|' || {row}status",
+    },
+    "it_tickets": {
+        "total": "''",
+        "priority": "{row}priority",
+        "status": "{row}status",
+        "assigned_to": "{row}assigned_to",
+        "priority|status": "{row}priority || '|' || {row}status",
+    },
+    "datasets": {
+        "total": "''",
+        "source": "{row}source",
+    },
+    "users": {
+        "total": "''",
+        "role": "{row}role",
+    },
+}
+
+COUNTER_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS kpi_counters (
+        domain TEXT NOT NULL,
+        dimension TEXT NOT NULL,
+        value TEXT NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (domain, dimension, value)
+    ) WITHOUT ROWID
+"""
+
+
+def _dimension_columns(table: str) -> list[str]:
+    """Columns whose updates can move a row between counter values."""
+    columns = []
+    for expr in COUNTER_DIMENSIONS[table].values():
+        for part in expr.split("{row}")[1:]:
+            column = part.split()[0]
+            if column not in columns:
+                columns.append(column)
+    return columns
+
+
+def _increment(table: str, dimension: str, expr: str, row: str) -> str:
+    return (
+        f"INSERT INTO kpi_counters (domain, dimension, value, count) "
+        f"VALUES ('{table}', '{dimension}', {expr.format(row=row)}, 1) "
+        f"ON CONFLICT (domain, dimension, value) DO UPDATE SET count = count + 1;"
+    )
+
+
+def _decrement(table: str, dimension: str, expr: str, row: str) -> str:
+    return (
+        f"UPDATE kpi_counters SET count = count - 1 "
+        f"WHERE domain = '{table}' AND dimension = '{dimension}' AND value = {expr.format(row=row)};"
+    )
+
+
+def counter_trigger_sql() -> list[str]:
+    """CREATE TRIGGER statements keeping kpi_counters exact on INSERT, UPDATE and DELETE."""
+    statements = []
+    for table, dimensions in COUNTER_DIMENSIONS.items():
+        inserts = "\n".join(_increment(table, dim, expr, "NEW.") for dim, expr in dimensions.items())
+        deletes = "\n".join(_decrement(table, dim, expr, "OLD.") for dim, expr in dimensions.items())
+        statements.append(f"CREATE TRIGGER IF NOT EXISTS trg_{table}_kpi_insert AFTER INSERT ON {table} BEGIN\n{inserts}\nEND")
+        statements.append(f"CREATE TRIGGER IF NOT EXISTS trg_{table}_kpi_delete AFTER DELETE ON {table} BEGIN\n{deletes}\nEND")
+        # Totals never change on UPDATE, so only the value dimensions are moved
+        moved = {dim: expr for dim, expr in dimensions.items() if dim != "total"}
+        updates = "\n".join(
+            [_decrement(table, dim, expr, "OLD.") for dim, expr in moved.items()]
+            + [_increment(table, dim, expr, "NEW.") for dim, expr in moved.items()]
+        )
+        columns = ", ".join(_dimension_columns(table))
+        statements.append(
+            f"CREATE TRIGGER IF NOT EXISTS trg_{table}_kpi_update AFTER UPDATE OF {columns} ON {table} BEGIN\n{updates}\nEND"
+        )
+    return statements
+
+
+def counter_rebuild_sql() -> list[str]:
+    """Statements that recompute kpi_counters from scratch."""
+    statements = ["DELETE FROM kpi_counters"]
+    for table, dimensions in COUNTER_DIMENSIONS.items():
+        for dimension, expr in dimensions.items():
+            statements.append(
+                f"INSERT INTO kpi_counters (domain, dimension, value, count) "
+                f"SELECT '{table}', '{dimension}', {expr.format(row='')}, COUNT(*) FROM {table} GROUP BY 3"
+            )
+    return statements
+
+
+def rebuild_counters(db: DatabaseManager) -> None:
+    """Recompute every counter in one transaction, e.g. after a bulk import with triggers dropped."""
+    with db.transaction():
+        for sql in counter_rebuild_sql():
+            db.execute_query(sql)
+
+
+class KpiCounters:
+    """O(1) KPI reads from the trigger-maintained kpi_counters table."""
+
+    def __init__(self, db: DatabaseManager):
+        self._db = db
+
+    def counts(self, domain: str, dimension: str) -> dict[str, int]:
+        """Return {value: count} for one dimension, largest first."""
+        rows = self._db.fetch_all(
+            "SELECT value, count FROM kpi_counters WHERE domain = ? AND dimension = ? AND count > 0 ORDER BY count DESC",
+            (domain, dimension),
+        )
+        return {value: count for value, count in rows}
+
+    def count(self, domain: str, dimension: str = "total", value: str = "") -> int:
+        """Return one counter; the default is the domain's row total."""
+        row = self._db.fetch_one(
+            "SELECT count FROM kpi_counters WHERE domain = ? AND dimension = ? AND value = ?",
+            (domain, dimension, value),
+        )
+        return row[0] if row is not None else 0
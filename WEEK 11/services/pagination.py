@@ -0,0 +1,56 @@
+import bisect
+from typing import Any, Callable
+
+
+class Page:
+    """One page of rows from a keyset (seek) pagination query."""
+
+    def __init__(self, items: list, key: Callable[[Any], Any], has_next: bool, has_previous: bool):
+        self._items = items
+        self._key = key
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def get_items(self) -> list:
+        """Get the rows on this page."""
+        return self._items
+
+    def get_first_key(self) -> Any:
+        """Key of the first row, used to seek to the previous page."""
+        return self._key(self._items[0]) if self._items else None
+
+    def get_last_key(self) -> Any:
+        """Key of the last row, used to seek to the next page."""
+        return self._key(self._items[-1]) if self._items else None
+
+    def has_next(self) -> bool:
+        """Check whether another page follows this one."""
+        return self._has_next
+
+    def has_previous(self) -> bool:
+        """Check whether a page precedes this one."""
+        return self._has_previous
+
+
+def build_page(rows: list, page_size: int, key: Callable[[Any], Any], after: Any = None, before: Any = None) -> Page:
+    """Turn a seek query result of up to page_size + 1 rows into a Page.
+    Rows fetched with `before` arrive in reverse order and are flipped back.
+    """
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if before is not None:
+        rows.reverse()
+        return Page(rows, key, has_next=True, has_previous=has_more)
+    return Page(rows, key, has_next=has_more, has_previous=after is not None)
+
+
+def paginate_list(items: list, key: Callable[[Any], Any], page_size: int,
+                  after: Any = None, before: Any = None) -> Page:
+    """Keyset-paginate a list already sorted ascending by key, seeking with bisect."""
+    if before is not None:
+        end = bisect.bisect_left(items, before, key=key)
+        start = max(end - page_size, 0)
+        return Page(items[start:end], key, has_next=True, has_previous=start > 0)
+    start = bisect.bisect_right(items, after, key=key) if after is not None else 0
+    end = start + page_size
+    return Page(items[start:end], key, has_next=end < len(items), has_previous=start > 0)
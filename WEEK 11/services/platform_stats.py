@@ -0,0 +1,89 @@
+import os
+import threading
+import time
+
+from services.database_manager import DatabaseManager
+
+
+class PlatformStats:
+    """Immutable snapshot of every cross-domain KPI counter."""
+
+    def __init__(self, counters: dict[tuple[str, str], dict[str, int]], fetched_at: float):
+        self._counters = counters
+        self._fetched_at = fetched_at
+
+    def count(self, domain: str, dimension: str = "total", value: str = "") -> int:
+        """Return one counter; the default is the domain's row total."""
+        return self._counters.get((domain, dimension), {}).get(value, 0)
+
+    def counts(self, domain: str, dimension: str) -> dict[str, int]:
+        """Return {value: count} for one dimension."""
+        return dict(self._counters.get((domain, dimension), {}))
+
+    def active_count(self, domain: str, dimension: str, value: str, excluded_status: str) -> int:
+        """Count rows with dimension == value whose status is not excluded_status,
+        e.g. critical incidents that are not Resolved.
+        """
+        pairs = self._counters.get((domain, f"{dimension}|status"), {})
+        return sum(count for key, count in pairs.items()
+                   if key.startswith(f"{value}|") and key != f"{value}|{excluded_status}")
+
+    def get_age(self) -> float:
+        """Seconds since the counters were read from the database."""
+        return time.monotonic() - self._fetched_at
+
+    def summary_text(self) -> str:
+        """One-line description of the platform state for AI prompts."""
+        return (
+            f"{self.count('security_incidents')} security incidents "
+            f"({self.active_count('security_incidents', 'severity', 'critical', 'Resolved')} critical unresolved), "
+            f"{self.count('datasets')} datasets, "
+            f"{self.count('it_tickets')} IT tickets ({self.count('it_tickets', 'status', 'Open')} open), "
+            f"{self.count('users')} users"
+        )
+
+
+class PlatformStatsService:
+    """Serves all KPI counters from one query, reusing the result for a short TTL."""
+
+    def __init__(self, db_path: str, ttl: float = 5.0):
+        self._db_path = db_path
+        self._ttl = ttl
+        self._stats: PlatformStats | None = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> PlatformStats:
+        """Read every counter in a single round trip."""
+        db = DatabaseManager(self._db_path, pooled=True, cached=True)
+        rows = db.fetch_all("SELECT domain, dimension, value, count FROM kpi_counters WHERE count > 0")
+        counters: dict[tuple[str, str], dict[str, int]] = {}
+        for domain, dimension, value, count in rows:
+            counters.setdefault((domain, dimension), {})[value] = count
+        return PlatformStats(counters, time.monotonic())
+
+    def get_stats(self, force_refresh: bool = False) -> PlatformStats:
+        """Return cached counters, reloading them once they are older than the TTL."""
+        with self._lock:
+            if force_refresh or self._stats is None or self._stats.get_age() > self._ttl:
+                self._stats = self._load()
+            return self._stats
+
+    def invalidate(self) -> None:
+        """Force the next get_stats() to reload."""
+        with self._lock:
+            self._stats = None
+
+
+_services: dict[str, PlatformStatsService] = {}
+_services_lock = threading.Lock()
+
+
+def get_platform_stats_service(db_path: str) -> PlatformStatsService:
+    """Return the process-wide stats service for a database file."""
+    key = os.path.abspath(db_path)
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            service = PlatformStatsService(db_path)
+            _services[key] = service
+        return service
@@ -0,0 +1,145 @@
+import re
+from typing import Any, Iterable
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_]\w*$")
+
+
+def check_identifier(name: str) -> str:
+    """Validate a table or column name before it is put into SQL."""
+    if not _IDENTIFIER.match(name):
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return name
+
+
+class Query:
+    """Composable SELECT that compiles to parameterized SQL.
+
+    Every method returns a new Query, so a base query can be shared and
+    narrowed down independently, e.g. for the list view and its row count.
+    """
+
+    OPERATORS = ("=", "!=", "<", "<=", ">", ">=", "LIKE")
+
+    def __init__(self, table: str, columns: Iterable[str] | None = None):
+        self._table = check_identifier(table)
+        self._columns = [check_identifier(column) for column in columns] if columns else []
+        self._conditions: list[tuple[str, tuple]] = []
+        self._order: list[str] = []
+        self._limit: int | None = None
+
+    def _copy(self) -> "Query":
+        query = Query.__new__(Query)
+        query._table = self._table
+        query._columns = list(self._columns)
+        query._conditions = list(self._conditions)
+        query._order = list(self._order)
+        query._limit = self._limit
+        return query
+
+    def get_table(self) -> str:
+        """Get the table this query reads from."""
+        return self._table
+
+    def get_columns(self) -> list[str]:
+        """Get the selected columns (empty means all)."""
+        return list(self._columns)
+
+    def select(self, *columns: str) -> "Query":
+        """Return a copy selecting only the given columns."""
+        query = self._copy()
+        query._columns = [check_identifier(column) for column in columns]
+        return query
+
+    def where(self, column: str, op: str, value: Any) -> "Query":
+        """Return a copy with an extra `column op ?` condition."""
+        if op not in self.OPERATORS:
+            raise ValueError(f"Unsupported operator: {op!r}")
+        query = self._copy()
+        query._conditions.append((f"{check_identifier(column)} {op} ?", (value,)))
+        return query
+
+    def where_in(self, column: str, values: Iterable[Any]) -> "Query":
+        """Return a copy with a `column IN (...)` condition."""
+        values = tuple(values)
+        query = self._copy()
+        if not values:
+            query._conditions.append(("0", ()))
+        else:
+            placeholders = ", ".join("?" for _ in values)
+            query._conditions.append((f"{check_identifier(column)} IN ({placeholders})", values))
+        return query
+
+    def filter(self, **equals: Any) -> "Query":
+        """Return a copy with `column = value` for every value that is not None."""
+        query = self
+        for column, value in equals.items():
+            if value is not None:
+                query = query.where(column, "=", value)
+        return query
+
+    def order_by(self, column: str, descending: bool = False) -> "Query":
+        """Return a copy ordered by this column only."""
+        query = self._copy()
+        query._order = [f"{check_identifier(column)} {'DESC' if descending else 'ASC'}"]
+        return query
+
+    def then_by(self, column: str, descending: bool = False) -> "Query":
+        """Return a copy with an extra tie-breaking sort column."""
+        query = self._copy()
+        query._order.append(f"{check_identifier(column)} {'DESC' if descending else 'ASC'}")
+        return query
+
+    def limit(self, count: int | None) -> "Query":
+        """Return a copy returning at most `count` rows."""
+        query = self._copy()
+        query._limit = count
+        return query
+
+    def _where_sql(self) -> tuple[str, tuple]:
+        if not self._conditions:
+            return "", ()
+        sql = " WHERE " + " AND ".join(condition for condition, _ in self._conditions)
+        params = tuple(param for _, values in self._conditions for param in values)
+        return sql, params
+
+    def to_sql(self) -> tuple[str, tuple]:
+        """Compile to (sql, params)."""
+        where_sql, params = self._where_sql()
+        columns = ", ".join(self._columns) or "*"
+        sql = f"SELECT {columns} FROM {self._table}{where_sql}"
+        if self._order:
+            sql += " ORDER BY " + ", ".join(self._order)
+        if self._limit is not None:
+            sql += " LIMIT ?"
+            params += (self._limit,)
+        return sql, params
+
+    def count_sql(self) -> tuple[str, tuple]:
+        """Compile a COUNT(*) over the same conditions, ignoring order and limit."""
+        where_sql, params = self._where_sql()
+        return f"SELECT COUNT(*) FROM {self._table}{where_sql}", params
+
+    def distinct_sql(self, column: str) -> tuple[str, tuple]:
+        """Compile a sorted SELECT DISTINCT of one column over the same conditions."""
+        column = check_identifier(column)
+        where_sql, params = self._where_sql()
+        return f"SELECT DISTINCT {column} FROM {self._table}{where_sql} ORDER BY {column}", params
+
+    def search_sql(self, index: str, expression: str) -> tuple[str, tuple]:
+        """Compile a ranked FTS5 search of `index` over this query's rows.
+        Each row gets a highlighted snippet of the matched text as an extra last column.
+        """
+        index = check_identifier(index)
+        where_sql, params = self._where_sql()
+        columns = ", ".join(f"t.{column}" for column in self._columns) or "t.*"
+        # CROSS JOIN keeps the MATCH as the outer loop, so only hits are looked up by id
+        sql = (
+            f"SELECT {columns}, snippet({index}, 0, '**', '**', '…', 12) FROM {index} "
+            f"CROSS JOIN (SELECT * FROM {self._table}{where_sql}) AS t ON t.id = {index}.rowid "
+            f"WHERE {index} MATCH ? ORDER BY {index}.rank"
+        )
+        params += (expression,)
+        if self._limit is not None:
+            sql += " LIMIT ?"
+            params += (self._limit,)
+        return sql, params
@@ -0,0 +1,142 @@
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+_READ_TABLES = re.compile(r"\b(?:FROM|JOIN)\s+([A-Za-z_]\w*)", re.IGNORECASE)
+_WRITE_TABLE = re.compile(
+    r"^\s*(?:INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|UPDATE(?:\s+OR\s+\w+)?|DELETE\s+FROM"
+    r"|CREATE\s+TABLE(?:\s+IF\s+NOT\s+EXISTS)?|DROP\s+TABLE(?:\s+IF\s+EXISTS)?|ALTER\s+TABLE)"
+    r"\s+([A-Za-z_]\w*)",
+    re.IGNORECASE,
+)
+
+_TRIGGER_WRITES = re.compile(
+    r"\b(?:INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|UPDATE(?:\s+OR\s+\w+)?|DELETE\s+FROM)\s+([A-Za-z_]\w*)",
+    re.IGNORECASE,
+)
+
+MISS = object()
+
+
+def tables_read(sql: str) -> frozenset[str]:
+    """Return the tables a SELECT reads from."""
+    return frozenset(name.lower() for name in _READ_TABLES.findall(sql))
+
+
+def table_written(sql: str) -> str | None:
+    """Return the table a write statement modifies, or None if it cannot be told."""
+    match = _WRITE_TABLE.match(sql)
+    return match.group(1).lower() if match else None
+
+
+def trigger_targets(trigger_sql: str) -> set[str]:
+    """Return the tables a trigger body writes to."""
+    body = trigger_sql.split("BEGIN", 1)[-1]
+    return {name.lower() for name in _TRIGGER_WRITES.findall(body)}
+
+
+class QueryCache:
+    """Thread-safe LRU cache of query results, invalidated per table.
+
+    Each table carries a version number that every write bumps. A result is
+    only stored if none of its tables changed while the query was running.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[Any, frozenset[str]]] = OrderedDict()
+        self._versions: dict[str, int] = {}
+        self._epoch = 0
+        # table -> tables its triggers write, loaded lazily from sqlite_master
+        self._dependents: dict[str, set[str]] | None = None
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for key, or MISS."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return MISS
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry[0]
+
+    def versions(self, tables: frozenset[str]) -> tuple:
+        """Capture table versions before running a query."""
+        with self._lock:
+            return self._epoch, tuple(self._versions.get(t, 0) for t in sorted(tables))
+
+    def put(self, key: Hashable, tables: frozenset[str], value: Any, versions: tuple) -> None:
+        """Store a result unless one of its tables was written since versions()."""
+        with self._lock:
+            current = (self._epoch, tuple(self._versions.get(t, 0) for t in sorted(tables)))
+            if current != versions:
+                return
+            self._entries[key] = (value, tables)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def needs_dependents(self) -> bool:
+        """Check whether trigger dependencies must be (re)loaded before invalidating."""
+        return self._dependents is None
+
+    def set_dependents(self, dependents: dict[str, set[str]]) -> None:
+        """Register which tables each table's triggers write to."""
+        with self._lock:
+            self._dependents = dependents
+
+    def _expand(self, tables: set[str]) -> set[str]:
+        """Add every table reachable through triggers. Caller holds the lock."""
+        expanded = set(tables)
+        pending = list(tables)
+        while pending and self._dependents:
+            for dependent in self._dependents.get(pending.pop(), ()):
+                if dependent not in expanded:
+                    expanded.add(dependent)
+                    pending.append(dependent)
+        return expanded
+
+    def invalidate(self, tables: set[str] | None = None) -> None:
+        """Drop entries reading any of the given tables (or tables their triggers
+        write), or everything when None.
+        """
+        with self._lock:
+            self._stats["invalidations"] += 1
+            if tables is None:
+                # Unknown statements may have changed the schema or triggers
+                self._epoch += 1
+                self._entries.clear()
+                self._dependents = None
+                return
+            tables = self._expand(tables)
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+            stale = [key for key, (_, read) in self._entries.items() if read & tables]
+            for key in stale:
+                del self._entries[key]
+
+    def stats(self) -> dict:
+        """Return hit/miss/eviction counters and current size."""
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries), "max_entries": self._max_entries}
+
+
+_caches: dict[str, QueryCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(db_path: str, **kwargs) -> QueryCache:
+    """Return the process-wide result cache for a database file."""
+    key = os.path.abspath(db_path)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = QueryCache(**kwargs)
+            _caches[key] = cache
+        return cache
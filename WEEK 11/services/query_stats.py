@@ -0,0 +1,115 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+SLOW_QUERY_ENV_VAR = "PLATFORM_SLOW_QUERY_MS"
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace and replace literals with ? so equivalent statements group together."""
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+class QueryStats:
+    """Thread-safe per-statement timing, slow-query log and plan capture."""
+
+    def __init__(self, slow_threshold_ms: float | None = None, slow_log_size: int = 100):
+        if slow_threshold_ms is None:
+            slow_threshold_ms = float(os.environ.get(SLOW_QUERY_ENV_VAR, 100))
+        self._slow_threshold_ms = slow_threshold_ms
+        self._statements: dict[str, dict] = {}
+        self._slow_log: deque[dict] = deque(maxlen=slow_log_size)
+        self._lock = threading.Lock()
+
+    def get_slow_threshold(self) -> float:
+        """Get the slow-query threshold in milliseconds."""
+        return self._slow_threshold_ms
+
+    def set_slow_threshold(self, threshold_ms: float) -> None:
+        """Set the slow-query threshold in milliseconds."""
+        self._slow_threshold_ms = threshold_ms
+
+    @staticmethod
+    def _explain(conn: sqlite3.Connection, sql: str, params: tuple) -> list[str]:
+        """Return EXPLAIN QUERY PLAN detail lines, or an empty list if it cannot be explained."""
+        try:
+            return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()]
+        except sqlite3.Error:
+            return []
+
+    def record(self, conn: sqlite3.Connection, sql: str, params: tuple, elapsed: float, rows: int) -> None:
+        """Record one execution; elapsed is in seconds."""
+        elapsed_ms = elapsed * 1000
+        key = normalize_sql(sql)
+        with self._lock:
+            entry = self._statements.get(key)
+            if entry is None:
+                entry = {"sql": key, "calls": 0, "rows": 0, "total_ms": 0.0, "max_ms": 0.0}
+                self._statements[key] = entry
+            entry["calls"] += 1
+            entry["rows"] += max(rows, 0)
+            entry["total_ms"] += elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+
+        if elapsed_ms >= self._slow_threshold_ms:
+            plan = self._explain(conn, sql, params)
+            with self._lock:
+                self._slow_log.append({
+                    "sql": key,
+                    "elapsed_ms": round(elapsed_ms, 3),
+                    "rows": rows,
+                    "at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                    "plan": plan,
+                })
+
+    def summary(self) -> list[dict]:
+        """Return per-statement aggregates, slowest total time first."""
+        with self._lock:
+            entries = [dict(entry) for entry in self._statements.values()]
+        for entry in entries:
+            entry["avg_ms"] = entry["total_ms"] / entry["calls"]
+        return sorted(entries, key=lambda e: e["total_ms"], reverse=True)
+
+    def slow_queries(self) -> list[dict]:
+        """Return the slow-query log, most recent first."""
+        with self._lock:
+            return list(reversed(self._slow_log))
+
+    def to_json(self) -> str:
+        """Export aggregates and the slow-query log as JSON."""
+        return json.dumps({
+            "slow_threshold_ms": self._slow_threshold_ms,
+            "statements": self.summary(),
+            "slow_queries": self.slow_queries(),
+        }, indent=2)
+
+    def reset(self) -> None:
+        """Clear all collected statistics."""
+        with self._lock:
+            self._statements.clear()
+            self._slow_log.clear()
+
+
+_stats: dict[str, QueryStats] = {}
+_stats_lock = threading.Lock()
+
+
+def get_query_stats(db_path: str) -> QueryStats:
+    """Return the process-wide query statistics for a database file."""
+    key = os.path.abspath(db_path)
+    with _stats_lock:
+        stats = _stats.get(key)
+        if stats is None:
+            stats = QueryStats()
+            _stats[key] = stats
+        return stats
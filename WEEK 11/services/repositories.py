@@ -0,0 +1,174 @@
+from abc import ABC, abstractmethod
+from itertools import islice
+from typing import Any, Iterable
+
+from models.dataset import Dataset
+from models.it_ticket import ITTicket
+from models.security_incident import SecurityIncident
+from models.user import User
+from services.database_manager import DatabaseManager
+from services.pagination import Page
+from services.query_builder import Query
+
+
+class Repository(ABC):
+    """Loads one table as model objects, running filters, ordering and limits in SQL.
+
+    Create one repository per request (Streamlit run): its identity map hands back
+    the same object for a key however many queries return that row, and columns in
+    `lazy_columns` are left out of every query until a model first asks for them.
+    """
+
+    table = ""
+    columns: tuple[str, ...] = ()  # the first column is the key
+    lazy_columns: tuple[str, ...] = ()
+    BATCH_SIZE = 500  # keys per IN (...) query
+
+    def __init__(self, db: DatabaseManager):
+        self._db = db
+        self._identity: dict[Any, Any] = {}
+        self._lazy_values: dict[str, dict[Any, Any]] = {column: {} for column in self.lazy_columns}
+        # Mapped keys whose lazy value is not loaded yet, in load order (dicts as ordered sets)
+        self._lazy_pending: dict[str, dict[Any, None]] = {column: {} for column in self.lazy_columns}
+
+    @abstractmethod
+    def _to_model(self, row: tuple) -> Any:
+        """Build the model for one row of `columns`."""
+
+    def _load(self, row: tuple) -> Any:
+        """Return the mapped model for a row, building it on first sight."""
+        key = row[0]
+        model = self._identity.get(key)
+        if model is None:
+            model = self._to_model(row)
+            self._identity[key] = model
+            for pending in self._lazy_pending.values():
+                pending[key] = None
+        return model
+
+    def clear(self) -> None:
+        """Forget every mapped model and lazily loaded value."""
+        self._identity.clear()
+        for column in self.lazy_columns:
+            self._lazy_values[column].clear()
+            self._lazy_pending[column].clear()
+
+    def load_lazy(self, key: Any, column: str) -> Any:
+        """Return a lazy column's value for one key.
+        The first access also fetches it for other mapped rows, so a list view costs one query.
+        """
+        values = self._lazy_values[column]
+        if key not in values:
+            pending = self._lazy_pending[column]
+            pending.pop(key, None)
+            batch = [key] + list(islice(pending, self.BATCH_SIZE - 1))
+            query = Query(self.table, (self.columns[0], column)).where_in(self.columns[0], batch)
+            values.update(self._db.fetch_all(*query.to_sql()))
+            for loaded in batch:
+                pending.pop(loaded, None)
+                values.setdefault(loaded, None)
+        return values[key]
+
+    def get(self, key: Any) -> Any:
+        """Return the model with this key, or None."""
+        models = self.get_many([key])
+        return models[0] if models else None
+
+    def get_many(self, keys: Iterable[Any]) -> list:
+        """Return the models for these keys in the given order, skipping unknown keys.
+        Only keys not already mapped are queried, in batches of BATCH_SIZE.
+        """
+        keys = list(dict.fromkeys(keys))
+        missing = [key for key in keys if key not in self._identity]
+        for start in range(0, len(missing), self.BATCH_SIZE):
+            self.find(self.query().where_in(self.columns[0], missing[start:start + self.BATCH_SIZE]))
+        return [self._identity[key] for key in keys if key in self._identity]
+
+    def query(self) -> Query:
+        """Return a Query over this table selecting the model's columns."""
+        return Query(self.table, self.columns)
+
+    def full_query(self) -> Query:
+        """Return a Query that also selects the lazy columns, e.g. for exports."""
+        return Query(self.table, self.columns + self.lazy_columns)
+
+    def find(self, query: Query | None = None) -> list:
+        """Return the models matching a query, or every row."""
+        rows = self._db.fetch_all(*(query or self.query()).to_sql())
+        return [self._load(row) for row in rows]
+
+    def count(self, query: Query | None = None) -> int:
+        """Count the rows matching a query without loading them."""
+        return self._db.fetch_one(*(query or self.query()).count_sql())[0]
+
+    def distinct(self, column: str, query: Query | None = None) -> list:
+        """Return the sorted distinct values of a column, e.g. for filter dropdowns."""
+        rows = self._db.fetch_all(*(query or self.query()).distinct_sql(column))
+        return [row[0] for row in rows if row[0] is not None]
+
+    def find_page(self, query: Query | None, page_size: int, after: Any = None, before: Any = None) -> Page:
+        """Return one keyset page of models, newest id first."""
+        page = self._db.fetch_page(query or self.query(), page_size, after=after, before=before)
+        models = [self._load(row) for row in page.get_items()]
+        return Page(models, key=lambda model: model.get_id(),
+                    has_next=page.has_next(), has_previous=page.has_previous())
+
+    def search(self, text: str, query: Query | None = None) -> list[tuple[Any, str]]:
+        """Return (model, snippet) pairs ranked by full-text relevance."""
+        rows = self._db.search(query or self.query(), text)
+        return [(self._load(row[:-1]), row[-1]) for row in rows]
+
+
+class _LazyIncident(SecurityIncident):
+    """SecurityIncident whose description is read from its repository on first access."""
+
+    __slots__ = ("_repository",)
+
+    def __init__(self, repository: "IncidentRepository", incident_id: int, incident_type: str,
+                 severity: str, status: str):
+        super().__init__(incident_id, "", incident_type, severity, status, "", "")
+        self._repository = repository
+
+    def get_description(self) -> str:
+        return self._repository.load_lazy(self.get_id(), "description") or ""
+
+
+class IncidentRepository(Repository):
+    """Security incidents as SecurityIncident objects; descriptions load lazily."""
+
+    table = "security_incidents"
+    columns = ("id", "incident_type", "severity", "status")
+    lazy_columns = ("description",)
+
+    def _to_model(self, row: tuple) -> SecurityIncident:
+        return _LazyIncident(self, row[0], row[1], row[2], row[3])
+
+
+class TicketRepository(Repository):
+    """IT tickets as ITTicket objects."""
+
+    table = "it_tickets"
+    columns = ("id", "title", "priority", "status")
+
+    def _to_model(self, row: tuple) -> ITTicket:
+        return ITTicket(row[0], row[1], row[2], row[3], "")
+
+
+class DatasetRepository(Repository):
+    """Datasets as Dataset objects, with the size in KB."""
+
+    table = "datasets"
+    columns = ("id", "name", "size_bytes", "rows", "source")
+
+    def _to_model(self, row: tuple) -> Dataset:
+        return Dataset(row[0], row[1], row[4], "", (row[2] or 0) // 1024)
+
+
+class UserRepository(Repository):
+    """Users as User objects, keyed by username."""
+
+    table = "users"
+    columns = ("username", "password_hash", "role")
+
+    def _to_model(self, row: tuple) -> User:
+        return User(row[0], row[1], row[2])
@@ -0,0 +1,71 @@
+import re
+import sqlite3
+import threading
+from typing import Iterable
+
+# Free-text columns with an FTS5 index: table -> (index table, indexed column)
+SEARCH_INDEXES: dict[str, tuple[str, str]] = {
+    "security_incidents": ("incidents_fts", "description"),
+    "it_tickets": ("tickets_fts", "title"),
+}
+
+# unicode61 folds case and accents; the prefix option pre-indexes 2 and 3
+# character prefixes so short "netw*" style queries stay cheap
+FTS_OPTIONS = "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'"
+
+_TERM = re.compile(r"\w+")
+
+
+def match_expression(text: str) -> str | None:
+    """Turn search box text into an FTS5 MATCH expression.
+    Every word becomes a quoted prefix term, so typed FTS5 syntax is searched literally.
+    Returns None when the text has no words.
+    """
+    terms = _TERM.findall(text)
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def search_index_sql() -> list[str]:
+    """Statements creating each external-content FTS5 index, the triggers
+    keeping it in sync with its table, and an initial rebuild.
+    """
+    statements = []
+    for table, (index, column) in SEARCH_INDEXES.items():
+        insert = f"INSERT INTO {index} (rowid, {column}) VALUES (NEW.id, NEW.{column});"
+        delete = f"INSERT INTO {index} ({index}, rowid, {column}) VALUES ('delete', OLD.id, OLD.{column});"
+        statements += [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {index} USING fts5("
+            f"{column}, content = '{table}', content_rowid = 'id', {FTS_OPTIONS})",
+            f"CREATE TRIGGER IF NOT EXISTS trg_{table}_fts_insert AFTER INSERT ON {table} BEGIN\n{insert}\nEND",
+            f"CREATE TRIGGER IF NOT EXISTS trg_{table}_fts_delete AFTER DELETE ON {table} BEGIN\n{delete}\nEND",
+            f"CREATE TRIGGER IF NOT EXISTS trg_{table}_fts_update AFTER UPDATE OF {column} ON {table} "
+            f"BEGIN\n{delete}\n{insert}\nEND",
+            f"INSERT INTO {index} ({index}) VALUES ('rebuild')",
+        ]
+    return statements
+
+
+class TextSearchIndex:
+    """In-memory FTS5 index over (id, text) pairs, for lists that are not
+    stored in SQLite such as the CSV-backed IT Operations tickets.
+    """
+
+    def __init__(self, documents: Iterable[tuple[int, str]]):
+        self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self._conn.execute(f"CREATE VIRTUAL TABLE documents USING fts5(body, {FTS_OPTIONS})")
+        self._conn.executemany("INSERT INTO documents (rowid, body) VALUES (?, ?)", documents)
+        self._lock = threading.Lock()
+
+    def search(self, text: str, limit: int | None = None) -> list[tuple[int, str]]:
+        """Return (id, highlighted snippet) pairs, best match first."""
+        expression = match_expression(text)
+        if expression is None:
+            return []
+        with self._lock:
+            return self._conn.execute(
+                "SELECT rowid, snippet(documents, 0, '**', '**', '…', 12) FROM documents "
+                "WHERE documents MATCH ? ORDER BY rank LIMIT ?",
+                (expression, -1 if limit is None else limit),
+            ).fetchall()
@@ -0,0 +1,69 @@
+from collections import Counter
+from datetime import date, timedelta
+
+GRAINS = ("day", "week", "month")
+
+
+def period_of(day: str, grain: str) -> str | None:
+    """Return the period key of an ISO date: the date itself, its week's Monday,
+    or YYYY-MM. Returns None for missing or unparseable dates.
+    """
+    try:
+        parsed = date.fromisoformat(str(day)[:10])
+    except ValueError:
+        return None
+    if grain == "day":
+        return parsed.isoformat()
+    if grain == "week":
+        return (parsed - timedelta(days=parsed.weekday())).isoformat()
+    if grain == "month":
+        return parsed.strftime("%Y-%m")
+    raise ValueError(f"Unknown grain: {grain!r}")
+
+
+class TimeRollup:
+    """Created counts per day, week and month, overall and per dimension value,
+    kept current one record at a time instead of regrouping every record.
+    """
+
+    def __init__(self, dimensions: list[str]):
+        self._dimensions = list(dimensions)
+        # (grain, dimension) -> Counter of (period, value)
+        self._counts: dict[tuple[str, str], Counter] = {
+            (grain, dimension): Counter() for grain in GRAINS for dimension in ["total"] + self._dimensions
+        }
+
+    def _apply(self, day: str, values: dict[str, str], delta: int) -> None:
+        for grain in GRAINS:
+            period = period_of(day, grain)
+            if period is None:
+                continue
+            self._counts[(grain, "total")][(period, "")] += delta
+            for dimension in self._dimensions:
+                self._counts[(grain, dimension)][(period, values.get(dimension, ""))] += delta
+
+    def add(self, day: str, **values: str) -> None:
+        """Count a new record created on `day` with the given dimension values."""
+        self._apply(day, values, 1)
+
+    def remove(self, day: str, **values: str) -> None:
+        """Uncount a deleted record."""
+        self._apply(day, values, -1)
+
+    def update(self, old_day: str, old_values: dict[str, str], new_day: str, new_values: dict[str, str]) -> None:
+        """Move an edited record between periods or dimension values."""
+        self._apply(old_day, old_values, -1)
+        self._apply(new_day, new_values, 1)
+
+    def totals(self, grain: str) -> dict[str, int]:
+        """Return {period: count} in period order."""
+        counts = self._counts[(grain, "total")]
+        return {period: count for (period, _), count in sorted(counts.items()) if count > 0}
+
+    def series(self, grain: str, dimension: str) -> dict[str, dict[str, int]]:
+        """Return {value: {period: count}} for one dimension, in period order."""
+        result: dict[str, dict[str, int]] = {}
+        for (period, value), count in sorted(self._counts[(grain, dimension)].items()):
+            if count > 0:
+                result.setdefault(value, {})[period] = count
+        return result
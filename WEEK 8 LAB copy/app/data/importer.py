@@ -0,0 +1,175 @@
+"""CSV Import Module"""
+
+import csv
+import os
+import time
+from app.data.db import connect_database
+
+CHUNK_SIZE = 5000
+
+# Declared SQLite column type -> Python converter
+TYPE_CONVERTERS = {"INTEGER": int, "REAL": float, "TEXT": str}
+
+
+def create_import_progress_table(conn):
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS import_progress (
+            table_name TEXT NOT NULL,
+            source TEXT NOT NULL,
+            signature TEXT NOT NULL,
+            rows_done INTEGER NOT NULL,
+            completed INTEGER NOT NULL DEFAULT 0,
+            start_rowid INTEGER,
+            PRIMARY KEY (table_name, source)
+        )
+    """)
+    # Progress tables from before start_rowid was tracked
+    cursor.execute("PRAGMA table_info(import_progress)")
+    if "start_rowid" not in [row[1] for row in cursor.fetchall()]:
+        cursor.execute("ALTER TABLE import_progress ADD COLUMN start_rowid INTEGER")
+    conn.commit()
+
+
+def is_import_unfinished(conn, csv_path, table):
+    """Check whether an import of this file into table was interrupted part way."""
+    create_import_progress_table(conn)
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT completed FROM import_progress WHERE table_name = ? AND source = ?",
+        (table, os.path.abspath(csv_path))
+    )
+    row = cursor.fetchone()
+    return row is not None and not row[0]
+
+
+def get_column_types(conn, table):
+    """Return {column: converter} from the table's declared column types."""
+    cursor = conn.cursor()
+    cursor.execute(f"PRAGMA table_info({table})")
+    return {row[1]: TYPE_CONVERTERS.get(row[2].upper(), str) for row in cursor.fetchall()}
+
+
+def _file_signature(csv_path):
+    info = os.stat(csv_path)
+    return f"{info.st_mtime_ns}:{info.st_size}"
+
+
+def _convert(converter, value):
+    return None if value == "" else converter(value)
+
+
+def _chunks(reader, chunk_size):
+    chunk = []
+    for row in reader:
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def import_csv(csv_path, table, conn=None, dtypes=None, skip_columns=(), replace=False,
+               chunk_size=CHUNK_SIZE, resume=True):
+    """Stream a CSV file into a table in chunks, one transaction per chunk.
+
+    Only one chunk is held in memory, so file size does not matter. Values are
+    converted with the table's declared column types unless dtypes overrides them.
+    Progress is committed with every chunk; if an import is interrupted, the next
+    call with resume=True continues after the last committed chunk. If the file
+    changed since then (or resume=False), the rows the unfinished import committed
+    are deleted first and the file is imported from the start, so nothing is
+    imported twice.
+    An unchanged file that was fully imported before is skipped.
+    Returns a dict with rows, seconds, rows_per_sec, resumed_from and skipped.
+    """
+    own_conn = conn is None
+    conn = conn or connect_database()
+    try:
+        create_import_progress_table(conn)
+        cursor = conn.cursor()
+        source = os.path.abspath(csv_path)
+        signature = _file_signature(csv_path)
+
+        rows_done = 0
+        cursor.execute(
+            "SELECT signature, rows_done, completed, start_rowid FROM import_progress "
+            "WHERE table_name = ? AND source = ?",
+            (table, source)
+        )
+        progress = cursor.fetchone()
+        if resume and progress is not None and progress[0] == signature:
+            if progress[2]:
+                return {"table": table, "rows": 0, "seconds": 0.0, "rows_per_sec": 0.0,
+                        "resumed_from": progress[1], "skipped": True}
+            rows_done = progress[1]
+            start_rowid = progress[3]
+        else:
+            if progress is not None and not progress[2] and not replace:
+                if progress[3] is None:
+                    raise ValueError(f"{csv_path}: unfinished import into {table} cannot be undone; "
+                                     f"import again with replace=True")
+                # Rows of the unfinished import all have a rowid above its starting point
+                cursor.execute(f"DELETE FROM {table} WHERE rowid > ?", (progress[3],))
+            elif replace:
+                cursor.execute(f"DELETE FROM {table}")
+            cursor.execute(f"SELECT COALESCE(MAX(rowid), 0) FROM {table}")
+            start_rowid = cursor.fetchone()[0]
+
+        types = {**get_column_types(conn, table), **(dtypes or {})}
+        start = time.perf_counter()
+        imported = 0
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            columns = [c for c in header if c in types and c not in skip_columns]
+            positions = [header.index(c) for c in columns]
+            converters = [types[c] for c in columns]
+            sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})"
+
+            # Skip rows a previous, interrupted run already committed
+            for _ in range(rows_done):
+                next(reader, None)
+
+            for chunk in _chunks(reader, chunk_size):
+                try:
+                    values = [
+                        [_convert(converter, row[pos]) for pos, converter in zip(positions, converters)]
+                        for row in chunk
+                    ]
+                except (ValueError, IndexError) as e:
+                    raise ValueError(f"{csv_path}: bad row after data row {rows_done}: {e}") from e
+                cursor.executemany(sql, values)
+                rows_done += len(chunk)
+                imported += len(chunk)
+                cursor.execute(
+                    "INSERT OR REPLACE INTO import_progress "
+                    "(table_name, source, signature, rows_done, completed, start_rowid) VALUES (?, ?, ?, ?, 0, ?)",
+                    (table, source, signature, rows_done, start_rowid)
+                )
+                conn.commit()
+
+        cursor.execute(
+            "INSERT OR REPLACE INTO import_progress "
+            "(table_name, source, signature, rows_done, completed, start_rowid) VALUES (?, ?, ?, ?, 1, ?)",
+            (table, source, signature, rows_done, start_rowid)
+        )
+        conn.commit()
+        seconds = time.perf_counter() - start
+        return {
+            "table": table,
+            "rows": imported,
+            "seconds": seconds,
+            "rows_per_sec": imported / seconds if seconds > 0 else 0.0,
+            "resumed_from": rows_done - imported,
+            "skipped": False,
+        }
+    except BaseException:
+        # Drop the uncommitted DELETE and chunk, or the next commit on a shared
+        # connection would apply them
+        conn.rollback()
+        raise
+    finally:
+        if own_conn:
+            conn.close()
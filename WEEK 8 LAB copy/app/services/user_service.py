@@ -15,7 +15,7 @@ def register_user(username, password, role='user'):
         bcrypt.gensalt()
     ).decode('utf-8')
     
-    insert_user(username, password_hash, role)
+    insert_user(None, username, password_hash, role)
     return True, f"User '{username}' registered successfully!"
 
 
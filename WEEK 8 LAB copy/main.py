@@ -5,38 +5,27 @@ from app.data.incidents import insert_incident, get_all_incidents
 from app.data.tickets import insert_ticket, get_all_tickets
 from app.data.datasets import insert_dataset, get_all_datasets
 from app.data.users import insert_user, get_all_users
+from app.data.importer import import_csv
 import pandas as pd
 
 
 def load_csv_data():
-    """Load CSV data into the database"""
-    try:
-        users_df = pd.read_csv('DATA/users.csv')
-        users_df.to_sql('users', connect_database(), if_exists='replace', index=False)
-        print(f" Loaded {len(users_df)} users")
-    except Exception as e:
-        print(f"  Users: {e}")
-    
-    try:
-        incidents_df = pd.read_csv('DATA/cyber_incidents.csv')
-        incidents_df.to_sql('cyber_incidents', connect_database(), if_exists='replace', index=False)
-        print(f" Loaded {len(incidents_df)} cyber incidents")
-    except Exception as e:
-        print(f"  Incidents: {e}")
-    
-    try:
-        tickets_df = pd.read_csv('DATA/it_tickets.csv')
-        tickets_df.to_sql('it_tickets', connect_database(), if_exists='replace', index=False)
-        print(f" Loaded {len(tickets_df)} IT tickets")
-    except Exception as e:
-        print(f"  Tickets: {e}")
-    
+    """Load CSV data into the database, streaming each file in chunks over one connection"""
+    conn = connect_database()
     try:
-        datasets_df = pd.read_csv('DATA/datasets_metadata.csv')
-        datasets_df.to_sql('datasets_metadata', connect_database(), if_exists='replace', index=False)
-        print(f" Loaded {len(datasets_df)} datasets")
-    except Exception as e:
-        print(f"  Datasets: {e}")
+        for label, csv_file, table in [
+            ("users", "DATA/users.csv", "users"),
+            ("cyber incidents", "DATA/cyber_incidents.csv", "cyber_incidents"),
+            ("IT tickets", "DATA/it_tickets.csv", "it_tickets"),
+            ("datasets", "DATA/datasets_metadata.csv", "datasets_metadata"),
+        ]:
+            try:
+                result = import_csv(csv_file, table, conn=conn, replace=True, resume=False)
+                print(f" Loaded {result['rows']} {label} ({result['rows_per_sec']:,.0f} rows/sec)")
+            except Exception as e:
+                print(f"  {label.capitalize()}: {e}")
+    finally:
+        conn.close()
 
 
 def test_authentication():
@@ -0,0 +1,40 @@
+import csv
+import sqlite3
+
+import pytest
+
+from app.data.importer import import_csv
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "name", "size"])
+        writer.writerows(rows)
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, size INTEGER)")
+    yield conn
+    conn.close()
+
+
+def test_failed_replace_import_leaves_prior_rows_intact(tmp_path, conn):
+    good = tmp_path / "good.csv"
+    bad = tmp_path / "bad.csv"
+    other = tmp_path / "other.csv"
+    write_csv(good, [(1, "a", 10), (2, "b", 20)])
+    write_csv(bad, [(1, "x", 1), (2, "y", "not a number")])
+    write_csv(other, [(3, "c", 30)])
+    import_csv(str(good), "items", conn=conn, replace=True)
+
+    with pytest.raises(ValueError):
+        import_csv(str(bad), "items", conn=conn, replace=True)
+    # A later import on the same connection must not commit the failed one's DELETE
+    import_csv(str(other), "items", conn=conn)
+
+    assert conn.execute("SELECT id, name, size FROM items ORDER BY id").fetchall() == [
+        (1, "a", 10), (2, "b", 20), (3, "c", 30)
+    ]
@@ -0,0 +1,126 @@
+import pandas as pd
+from app.data.db import connect_database
+
+# Period key per grain; weeks are keyed by their Monday
+GRAINS = {
+    "day": "date({col})",
+    "week": "date({col}, 'weekday 0', '-6 days')",
+    "month": "strftime('%Y-%m', {col})",
+}
+
+# Source table -> (date column, dimensions counted per period)
+ROLLUP_SOURCES = {
+    "cyber_incidents": ("date", ["total", "severity", "status"]),
+    "it_tickets": ("created_date", ["total", "priority", "status"]),
+}
+
+
+def _value(dimension, row):
+    return "''" if dimension == "total" else f"{row}{dimension}"
+
+
+def _increment(table, date_col, row):
+    statements = []
+    for grain, expr in GRAINS.items():
+        period = expr.format(col=f"{row}{date_col}")
+        for dimension in ROLLUP_SOURCES[table][1]:
+            statements.append(f"""
+        INSERT INTO time_rollups (domain, grain, dimension, period, value, count)
+        SELECT '{table}', '{grain}', '{dimension}', {period}, COALESCE({_value(dimension, row)}, ''), 1
+        WHERE {period} IS NOT NULL
+        ON CONFLICT (domain, grain, dimension, period, value) DO UPDATE SET count = count + 1;""")
+    return "".join(statements)
+
+
+def _decrement(table, date_col, row):
+    statements = []
+    for grain, expr in GRAINS.items():
+        period = expr.format(col=f"{row}{date_col}")
+        for dimension in ROLLUP_SOURCES[table][1]:
+            statements.append(f"""
+        UPDATE time_rollups SET count = count - 1
+        WHERE domain = '{table}' AND grain = '{grain}' AND dimension = '{dimension}'
+          AND period = {period} AND value = COALESCE({_value(dimension, row)}, '');""")
+    return "".join(statements)
+
+
+def create_rollup_tables(conn):
+    """Create time_rollups and the triggers that keep it current.
+    The table is filled from existing rows the first time it is created.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'time_rollups'")
+    exists = cursor.fetchone() is not None
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS time_rollups (
+            domain TEXT NOT NULL,
+            grain TEXT NOT NULL,
+            dimension TEXT NOT NULL,
+            period TEXT NOT NULL,
+            value TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (domain, grain, dimension, period, value)
+        ) WITHOUT ROWID
+    """)
+    for table, (date_col, dimensions) in ROLLUP_SOURCES.items():
+        watched = ", ".join([date_col] + [d for d in dimensions if d != "total"])
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_rollup_insert AFTER INSERT ON {table}
+            BEGIN{_increment(table, date_col, "NEW.")}
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_rollup_update AFTER UPDATE OF {watched} ON {table}
+            BEGIN{_decrement(table, date_col, "OLD.")}{_increment(table, date_col, "NEW.")}
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_rollup_delete AFTER DELETE ON {table}
+            BEGIN{_decrement(table, date_col, "OLD.")}
+            END
+        """)
+    if not exists:
+        rebuild_rollups(conn)
+    conn.commit()
+    print(" Time rollups table created")
+
+
+def rebuild_rollups(conn):
+    """Recompute every rollup from the source tables."""
+    cursor = conn.cursor()
+    cursor.execute("DELETE FROM time_rollups")
+    for table, (date_col, dimensions) in ROLLUP_SOURCES.items():
+        for grain, expr in GRAINS.items():
+            period = expr.format(col=date_col)
+            for dimension in dimensions:
+                cursor.execute(f"""
+                    INSERT INTO time_rollups (domain, grain, dimension, period, value, count)
+                    SELECT '{table}', '{grain}', '{dimension}', {period}, COALESCE({_value(dimension, "")}, ''), COUNT(*)
+                    FROM {table} WHERE {period} IS NOT NULL
+                    GROUP BY 4, 5
+                """)
+    conn.commit()
+
+
+def get_timeline(table, grain="day", dimension="total"):
+    """Return created counts per period as a DataFrame with period, value and count columns."""
+    conn = connect_database()
+    df = pd.read_sql_query(
+        """
+        SELECT period, value, count FROM time_rollups
+        WHERE domain = ? AND grain = ? AND dimension = ? AND count > 0
+        ORDER BY period, value
+        """,
+        conn,
+        params=(table, grain, dimension)
+    )
+    conn.close()
+    return df
+
+
+if __name__ == "__main__":
+    conn = connect_database()
+    create_rollup_tables(conn)
+    rebuild_rollups(conn)
+    conn.close()
+    print("\n Rollups rebuilt!")
@@ -1,4 +1,5 @@
 from app.data.db import connect_database
+from app.data.rollups import create_rollup_tables
 
 
 def create_users_table(conn):
@@ -67,6 +68,7 @@ def create_all_tables(conn):
     create_cyber_incidents_table(conn)
     create_datasets_metadata_table(conn)
     create_it_tickets_table(conn)
+    create_rollup_tables(conn)
 
 
 if __name__ == "__main__":
@@ -4,6 +4,7 @@ import plotly.express as px
 from pathlib import Path
 from app.data.db import connect_database
 from app.data.schema import create_all_tables
+from app.data.rollups import get_timeline
 
 st.set_page_config(
     page_title="Cybersecurity Dashboard",
@@ -158,14 +159,14 @@ try:
             
             with col2:
                 st.subheader("Incidents Timeline")
-                incidents_df['date'] = pd.to_datetime(incidents_df['date'])
-                timeline_df = incidents_df.groupby(incidents_df['date'].dt.date).size().reset_index()
-                timeline_df.columns = ['date', 'count']
+                # Counts come from the trigger-maintained time_rollups table
+                grain = st.radio("Group by", ["day", "week", "month"], horizontal=True, key="incident_grain")
+                timeline_df = get_timeline("cyber_incidents", grain)
                 fig = px.line(
                     timeline_df,
-                    x='date',
+                    x='period',
                     y='count',
-                    labels={'date': 'Date', 'count': 'Number of Incidents'},
+                    labels={'period': 'Date', 'count': 'Number of Incidents'},
                     markers=True
                 )
                 st.plotly_chart(fig, use_container_width=True)
@@ -247,14 +248,13 @@ try:
             
             with col1:
                 st.subheader("Tickets Timeline")
-                tickets_df['created_date'] = pd.to_datetime(tickets_df['created_date'])
-                timeline_df = tickets_df.groupby(tickets_df['created_date'].dt.date).size().reset_index()
-                timeline_df.columns = ['date', 'count']
+                grain = st.radio("Group by", ["day", "week", "month"], horizontal=True, key="ticket_grain")
+                timeline_df = get_timeline("it_tickets", grain)
                 fig = px.line(
                     timeline_df,
-                    x='date',
+                    x='period',
                     y='count',
-                    labels={'date': 'Date', 'count': 'Number of Tickets'},
+                    labels={'period': 'Date', 'count': 'Number of Tickets'},
                     markers=True
                 )
                 st.plotly_chart(fig, use_container_width=True)